@@ -1,43 +1,63 @@
 """Market context - centralized state container for market maker.
 
 Replaces global state with dependency-injected context.
-Thread-safe updates with proper synchronization.
+Updates are synchronous, so each is atomic with respect to the event loop.
 """
 
 from __future__ import annotations
 
 import asyncio
+import math
+import operator
+import time
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from decimal import Decimal
+from itertools import islice, pairwise
 from typing import TYPE_CHECKING
 
+from samples.okx_market_maker.core.utils.instrument_util import get_quantizer
+from samples.okx_market_maker.domain.enums import TERMINAL_STATE_MASK, Side
+
 if TYPE_CHECKING:
     from okx_client_gw.domain.models.account import AccountBalance
     from okx_client_gw.domain.models.instrument import Instrument
     from okx_client_gw.domain.models.orderbook import OrderBook
     from okx_client_gw.domain.models.position import Position
     from okx_client_gw.domain.models.ticker import Ticker
+    from samples.okx_market_maker.core.utils.instrument_util import Quantizer
     from samples.okx_market_maker.domain.models.strategy_order import StrategyOrder
 
+_ZERO = Decimal("0")
+
+# Instrument defaults used before instrument metadata is loaded
+_DEFAULT_TICK_SIZE = Decimal("0.01")
+_DEFAULT_LOT_SIZE = Decimal("0.0001")
+_DEFAULT_MIN_SIZE = Decimal("0.0001")
 
-@dataclass
+
+@dataclass(slots=True)
 class MarketContext:
     """Centralized state container for market maker.
 
     Holds all market data and account state needed for strategy decisions.
     Designed to replace global state with explicit dependency injection.
 
-    Thread-safe: Uses asyncio.Lock for concurrent updates.
+    Concurrency: All update_* methods are synchronous (no await), so each
+    one runs atomically on the event loop and single updates need no lock.
+    The lock is only needed by callers that await between related reads
+    and writes.
 
     Attributes:
         inst_id: Instrument being traded
         instrument: Instrument specification (tick size, lot size, etc.)
-        orderbook: Current order book snapshot
+        orderbook: Current order book snapshot (set via update_orderbook)
         ticker: Current ticker data
         account: Current account balance
         positions: Current positions by instrument
-        live_orders: Active strategy orders by client order ID
+        live_orders: Active strategy orders by client order ID (set via add_order)
         net_filled_buy: Net filled buy quantity
         net_filled_sell: Net filled sell quantity
 
@@ -45,9 +65,8 @@ class MarketContext:
         context = MarketContext(inst_id="BTC-USDT")
 
         # Update market data
-        async with context.lock:
-            context.update_orderbook(orderbook)
-            context.update_ticker(ticker)
+        context.update_orderbook(orderbook)
+        context.update_ticker(ticker)
 
         # Check data freshness
         if context.is_data_fresh():
@@ -66,66 +85,107 @@ class MarketContext:
     net_filled_buy: Decimal = Decimal("0")
     net_filled_sell: Decimal = Decimal("0")
 
-    # Timestamps for staleness checking
+    # Wall-clock timestamps (for logging/display)
     orderbook_time: datetime | None = None
     ticker_time: datetime | None = None
     account_time: datetime | None = None
     position_time: datetime | None = None
 
-    # Volatility tracking for volatility strategy
-    recent_prices: list[Decimal] = field(default_factory=list)
+    # Update counters, bumped on every update_* call (cheap change detection)
+    orderbook_seq: int = 0
+    account_seq: int = 0
+    position_seq: int = 0
+    order_seq: int = 0  # add_order/remove_order/refresh_order/clear_terminal_orders
+    price_seq: int = 0  # bumped whenever the recent_prices history changes
+
+    # Monotonic timestamps for staleness checking
+    _orderbook_mono: float | None = field(default=None, repr=False)
+    _account_mono: float | None = field(default=None, repr=False)
+    _position_mono: float | None = field(default=None, repr=False)
+
+    # Volatility tracking for volatility strategy (bounded to max_price_history).
+    # Private so every change goes through code that bumps price_seq.
+    _recent_prices: deque[Decimal] = field(default_factory=deque, init=False, repr=False)
     max_price_history: int = 100
 
+    # Mid move, as a fraction of the last decided mid, that sets book_moved
+    # (None disables early wake-ups)
+    requote_move_pct: float | None = None
+
+    # Top-of-book prices, recomputed once per orderbook update. Spread is
+    # derived on read since nothing per-message needs it.
+    _best_bid: Decimal | None = field(default=None, init=False, repr=False)
+    _best_ask: Decimal | None = field(default=None, init=False, repr=False)
+    _mid_price: Decimal | None = field(default=None, init=False, repr=False)
+
+    # Active orders indexed by side (maintained by add_order/remove_order)
+    _active_buys: dict[str, StrategyOrder] = field(default_factory=dict, init=False, repr=False)
+    _active_sells: dict[str, StrategyOrder] = field(default_factory=dict, init=False, repr=False)
+
+    # Running size * price totals of the side indexes, and each order's share
+    _buy_exposure: Decimal = field(default=_ZERO, init=False, repr=False)
+    _sell_exposure: Decimal = field(default=_ZERO, init=False, repr=False)
+    _order_exposure: dict[str, Decimal] = field(default_factory=dict, init=False, repr=False)
+
+    # Last calculate_volatility result and the price-history state it was computed for
+    _volatility_key: tuple[int, int] | None = field(default=None, init=False, repr=False)
+    _volatility: Decimal | None = field(default=None, init=False, repr=False)
+
+    # Requote band around the last decided mid (set by mark_decided)
+    _requote_low: Decimal | None = field(default=None, init=False, repr=False)
+    _requote_high: Decimal | None = field(default=None, init=False, repr=False)
+
+    # Quantizer and the instrument it was built for (rebuilt when that changes)
+    _quantizer: Quantizer | None = field(default=None, init=False, repr=False)
+    _quantizer_instrument: Instrument | None = field(default=None, init=False, repr=False)
+
     # Synchronization
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    book_moved: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def __post_init__(self) -> None:
+        """Bound the price history and derive prices from the initial orderbook."""
+        self._recent_prices = deque(maxlen=self.max_price_history)
+        self._refresh_book_prices()
+        for order in self.live_orders.values():
+            self._index_order(order)
 
     @property
     def lock(self) -> asyncio.Lock:
-        """Get the context lock for thread-safe updates."""
+        """Get the context lock for updates that span an await."""
         return self._lock
 
     # --- Market Data Properties ---
 
     @property
     def best_bid(self) -> Decimal | None:
-        """Get best bid price from orderbook."""
-        if self.orderbook is None or not self.orderbook.bids:
-            return None
-        return self.orderbook.bids[0].price
+        """Get best bid price (cached per orderbook update)."""
+        return self._best_bid
 
     @property
     def best_ask(self) -> Decimal | None:
-        """Get best ask price from orderbook."""
-        if self.orderbook is None or not self.orderbook.asks:
-            return None
-        return self.orderbook.asks[0].price
+        """Get best ask price (cached per orderbook update)."""
+        return self._best_ask
 
     @property
     def mid_price(self) -> Decimal | None:
-        """Calculate mid price from best bid/ask."""
-        bid = self.best_bid
-        ask = self.best_ask
-        if bid is None or ask is None:
-            return None
-        return (bid + ask) / 2
+        """Get mid price from best bid/ask (cached per orderbook update)."""
+        return self._mid_price
 
     @property
     def spread(self) -> Decimal | None:
         """Calculate current spread."""
-        bid = self.best_bid
-        ask = self.best_ask
-        if bid is None or ask is None:
+        if self._mid_price is None:
             return None
-        return ask - bid
+        return self._best_ask - self._best_bid
 
     @property
     def spread_pct(self) -> Decimal | None:
         """Calculate spread as percentage of mid price."""
-        spread = self.spread
-        mid = self.mid_price
-        if spread is None or mid is None or mid == 0:
+        mid = self._mid_price
+        if mid is None or mid == 0:
             return None
-        return spread / mid
+        return (self._best_ask - self._best_bid) / mid
 
     @property
     def last_price(self) -> Decimal | None:
@@ -156,29 +216,84 @@ class MarketContext:
 
     # --- Order Properties ---
 
+    @staticmethod
+    def _active_on_side(index: dict[str, StrategyOrder]) -> list[StrategyOrder]:
+        """Get active orders from a side index.
+
+        Terminal transitions go through refresh_order/remove_order, which
+        unindex the order; the mask test only skips an order that went
+        terminal since, without changing the index.
+
+        Args:
+            index: Side index of orders that were active when indexed
+
+        Returns:
+            Active orders on that side
+        """
+        return [order for order in index.values() if not order.state.flag & TERMINAL_STATE_MASK]
+
     @property
     def active_buy_orders(self) -> list[StrategyOrder]:
         """Get all active buy orders."""
-        from samples.okx_market_maker.domain.enums import OrderState
-
-        return [
-            order for order in self.live_orders.values()
-            if order.side == "buy" and order.state not in (
-                OrderState.FILLED, OrderState.CANCELED, OrderState.REJECTED
-            )
-        ]
+        return self._active_on_side(self._active_buys)
 
     @property
     def active_sell_orders(self) -> list[StrategyOrder]:
         """Get all active sell orders."""
-        from samples.okx_market_maker.domain.enums import OrderState
+        return self._active_on_side(self._active_sells)
 
-        return [
-            order for order in self.live_orders.values()
-            if order.side == "sell" and order.state not in (
-                OrderState.FILLED, OrderState.CANCELED, OrderState.REJECTED
-            )
-        ]
+    def partition_active_orders(self) -> tuple[list[StrategyOrder], list[StrategyOrder]]:
+        """Get active buy and sell orders together.
+
+        Returns:
+            Tuple of (active buy orders, active sell orders)
+        """
+        return (
+            self._active_on_side(self._active_buys),
+            self._active_on_side(self._active_sells),
+        )
+
+    @property
+    def buy_exposure(self) -> Decimal:
+        """Get total size * price of active buy orders.
+
+        Maintained as orders are added, refreshed and removed.
+        """
+        return self._buy_exposure
+
+    @property
+    def sell_exposure(self) -> Decimal:
+        """Get total size * price of active sell orders.
+
+        Maintained as orders are added, refreshed and removed.
+        """
+        return self._sell_exposure
+
+    def check_exposure(self) -> None:
+        """Verify the side indexes and running exposure totals.
+
+        A debugging aid: it walks every indexed order, so keep it off the
+        hot path.
+
+        Raises:
+            AssertionError: If a terminal order is still indexed as active,
+                or either side's running total has drifted
+        """
+        for side, index, total in (
+            (Side.BUY, self._active_buys, self._buy_exposure),
+            (Side.SELL, self._active_sells, self._sell_exposure),
+        ):
+            terminal = [
+                cl_ord_id for cl_ord_id, order in index.items()
+                if order.state.flag & TERMINAL_STATE_MASK
+            ]
+            if terminal:
+                raise AssertionError(f"Terminal {side} orders still indexed: {terminal}")
+            expected = sum((order.size * order.price for order in index.values()), _ZERO)
+            if expected != total:
+                raise AssertionError(
+                    f"{side} exposure drifted: tracked {total}, actual {expected}"
+                )
 
     @property
     def num_active_buy_orders(self) -> int:
@@ -196,73 +311,174 @@ class MarketContext:
     def tick_size(self) -> Decimal:
         """Get tick size from instrument, default to 0.01."""
         if self.instrument is None:
-            return Decimal("0.01")
+            return _DEFAULT_TICK_SIZE
         return self.instrument.tick_sz
 
     @property
     def lot_size(self) -> Decimal:
         """Get lot size from instrument, default to 0.0001."""
         if self.instrument is None:
-            return Decimal("0.0001")
+            return _DEFAULT_LOT_SIZE
         return self.instrument.lot_sz
 
     @property
     def min_size(self) -> Decimal:
         """Get minimum order size from instrument."""
         if self.instrument is None:
-            return Decimal("0.0001")
+            return _DEFAULT_MIN_SIZE
         return self.instrument.min_sz
 
+    @property
+    def quantizer(self) -> Quantizer:
+        """Get the tick/lot quantizer for the current instrument.
+
+        Cached per instrument object, so strategies reading it every cycle
+        skip the get_quantizer lookup.
+        """
+        quantizer = self._quantizer
+        if quantizer is None or self._quantizer_instrument is not self.instrument:
+            quantizer = get_quantizer(self.tick_size, self.lot_size)
+            self._quantizer = quantizer
+            self._quantizer_instrument = self.instrument
+        return quantizer
+
     # --- Data Freshness ---
 
-    def is_orderbook_fresh(self, max_age_sec: float = 5.0) -> bool:
+    @staticmethod
+    def _age(mono: float | None, now: float | None) -> float:
+        """Calculate age in seconds of a monotonic timestamp.
+
+        Args:
+            mono: Monotonic timestamp of the last update
+            now: Current monotonic time (read from the clock if None)
+
+        Returns:
+            Age in seconds, or inf if never updated
+        """
+        if mono is None:
+            return float("inf")
+        if now is None:
+            now = time.monotonic()
+        return now - mono
+
+    def orderbook_age(self, now: float | None = None) -> float:
+        """Get orderbook data age in seconds (inf if never updated)."""
+        return self._age(self._orderbook_mono, now)
+
+    def account_age(self, now: float | None = None) -> float:
+        """Get account data age in seconds (inf if never updated)."""
+        return self._age(self._account_mono, now)
+
+    def position_age(self, now: float | None = None) -> float:
+        """Get position data age in seconds (inf if never updated)."""
+        return self._age(self._position_mono, now)
+
+    def is_orderbook_fresh(self, max_age_sec: float = 5.0, now: float | None = None) -> bool:
         """Check if orderbook data is fresh.
 
         Args:
             max_age_sec: Maximum age in seconds
+            now: Current monotonic time (read from the clock if None)
 
         Returns:
             True if orderbook was updated within max_age_sec
         """
-        if self.orderbook_time is None:
-            return False
-        age = (datetime.now(UTC) - self.orderbook_time).total_seconds()
-        return age <= max_age_sec
+        return self.orderbook_age(now) <= max_age_sec
 
-    def is_account_fresh(self, max_age_sec: float = 10.0) -> bool:
+    def is_account_fresh(self, max_age_sec: float = 10.0, now: float | None = None) -> bool:
         """Check if account data is fresh.
 
         Args:
             max_age_sec: Maximum age in seconds
+            now: Current monotonic time (read from the clock if None)
 
         Returns:
             True if account was updated within max_age_sec
         """
-        if self.account_time is None:
-            return False
-        age = (datetime.now(UTC) - self.account_time).total_seconds()
-        return age <= max_age_sec
+        return self.account_age(now) <= max_age_sec
 
-    def is_position_fresh(self, max_age_sec: float = 10.0) -> bool:
+    def is_position_fresh(self, max_age_sec: float = 10.0, now: float | None = None) -> bool:
         """Check if position data is fresh.
 
         Args:
             max_age_sec: Maximum age in seconds
+            now: Current monotonic time (read from the clock if None)
 
         Returns:
             True if position was updated within max_age_sec
         """
-        if self.position_time is None:
+        if self._position_mono is None:
             # No position data yet is ok if we have no position
             return True
-        age = (datetime.now(UTC) - self.position_time).total_seconds()
-        return age <= max_age_sec
+        return self.position_age(now) <= max_age_sec
+
+    def freshness_snapshot(
+        self,
+        orderbook_max_age: float,
+        account_max_age: float,
+        position_max_age: float,
+        now: float,
+    ) -> tuple[bool, bool, bool]:
+        """Evaluate orderbook, account and position freshness in one call.
+
+        Equivalent to calling the three is_*_fresh methods with the same now,
+        without the per-check method calls.
+
+        Args:
+            orderbook_max_age: Max orderbook age in seconds
+            account_max_age: Max account age in seconds
+            position_max_age: Max position age in seconds
+            now: Current monotonic time
+
+        Returns:
+            Tuple of (orderbook_fresh, account_fresh, position_fresh)
+        """
+        orderbook_mono = self._orderbook_mono
+        account_mono = self._account_mono
+        position_mono = self._position_mono
+        return (
+            orderbook_mono is not None and now - orderbook_mono <= orderbook_max_age,
+            account_mono is not None and now - account_mono <= account_max_age,
+            position_mono is None or now - position_mono <= position_max_age,
+        )
+
+    def fresh_until(
+        self,
+        orderbook_max_age: float,
+        account_max_age: float,
+        position_max_age: float,
+    ) -> float:
+        """Get the monotonic time at which the first freshness check expires.
+
+        Until then, and absent new updates, freshness_snapshot with the same
+        max ages cannot report anything as stale.
+
+        Args:
+            orderbook_max_age: Max orderbook age in seconds
+            account_max_age: Max account age in seconds
+            position_max_age: Max position age in seconds
+
+        Returns:
+            Earliest expiry time (-inf if orderbook or account data is missing,
+            inf if nothing can expire)
+        """
+        orderbook_mono = self._orderbook_mono
+        account_mono = self._account_mono
+        if orderbook_mono is None or account_mono is None:
+            return float("-inf")
+        position_mono = self._position_mono
+        return min(
+            orderbook_mono + orderbook_max_age,
+            account_mono + account_max_age,
+            float("inf") if position_mono is None else position_mono + position_max_age,
+        )
 
     def is_data_fresh(
         self,
         orderbook_max_age: float = 5.0,
         account_max_age: float = 10.0,
         position_max_age: float = 10.0,
+        now: float | None = None,
     ) -> bool:
         """Check if all required data is fresh.
 
@@ -270,18 +486,31 @@ class MarketContext:
             orderbook_max_age: Max orderbook age in seconds
             account_max_age: Max account age in seconds
             position_max_age: Max position age in seconds
+            now: Current monotonic time (read from the clock if None)
 
         Returns:
             True if all data is fresh enough for trading
         """
+        if now is None:
+            now = time.monotonic()
         return (
-            self.is_orderbook_fresh(orderbook_max_age)
-            and self.is_account_fresh(account_max_age)
-            and self.is_position_fresh(position_max_age)
+            self.is_orderbook_fresh(orderbook_max_age, now)
+            and self.is_account_fresh(account_max_age, now)
+            and self.is_position_fresh(position_max_age, now)
         )
 
     # --- Update Methods ---
 
+    def _refresh_book_prices(self) -> None:
+        """Recompute best bid/ask and mid price from the orderbook."""
+        orderbook = self.orderbook
+        bid = orderbook.bids[0].price if orderbook is not None and orderbook.bids else None
+        ask = orderbook.asks[0].price if orderbook is not None and orderbook.asks else None
+        self._best_bid = bid
+        self._best_ask = ask
+
+        self._mid_price = None if bid is None or ask is None else (bid + ask) / 2
+
     def update_orderbook(self, orderbook: OrderBook) -> None:
         """Update orderbook and timestamp.
 
@@ -290,12 +519,37 @@ class MarketContext:
         """
         self.orderbook = orderbook
         self.orderbook_time = datetime.now(UTC)
-
-        # Track price for volatility
-        if self.mid_price is not None:
-            self.recent_prices.append(self.mid_price)
-            if len(self.recent_prices) > self.max_price_history:
-                self.recent_prices.pop(0)
+        self._orderbook_mono = time.monotonic()
+        self.orderbook_seq += 1
+        self._refresh_book_prices()
+
+        # Track price for volatility, only when the mid actually moved
+        mid = self._mid_price
+        recent_prices = self._recent_prices
+        if mid is not None and (not recent_prices or recent_prices[-1] != mid):
+            recent_prices.append(mid)
+            self.price_seq += 1
+
+            # Wake the main loop once the mid leaves the requote band
+            low = self._requote_low
+            if low is not None and not low <= mid <= self._requote_high:
+                self.book_moved.set()
+
+    def mark_decided(self) -> None:
+        """Record the current mid as the one the strategy is deciding on.
+
+        Clears book_moved and re-centres the requote band on the current mid,
+        so the event is set again only after the mid moves more than
+        requote_move_pct away from it.
+        """
+        self.book_moved.clear()
+        mid = self._mid_price
+        if mid is None or self.requote_move_pct is None:
+            self._requote_low = self._requote_high = None
+            return
+        band = mid * Decimal(str(self.requote_move_pct))
+        self._requote_low = mid - band
+        self._requote_high = mid + band
 
     def update_ticker(self, ticker: Ticker) -> None:
         """Update ticker and timestamp.
@@ -314,6 +568,8 @@ class MarketContext:
         """
         self.account = account
         self.account_time = datetime.now(UTC)
+        self._account_mono = time.monotonic()
+        self.account_seq += 1
 
     def update_position(self, position: Position) -> None:
         """Update position for an instrument.
@@ -323,6 +579,8 @@ class MarketContext:
         """
         self.positions[position.inst_id] = position
         self.position_time = datetime.now(UTC)
+        self._position_mono = time.monotonic()
+        self.position_seq += 1
 
     def update_instrument(self, instrument: Instrument) -> None:
         """Update instrument specification.
@@ -334,13 +592,59 @@ class MarketContext:
 
     # --- Order Management ---
 
+    def _index_order(self, order: StrategyOrder) -> None:
+        """Add an order to its side index and exposure if it is active.
+
+        Args:
+            order: Strategy order to index
+        """
+        if not order.is_active:
+            return
+        cl_ord_id = order.cl_ord_id
+        value = order.size * order.price
+        if order.side is Side.BUY:
+            self._active_buys[cl_ord_id] = order
+            self._buy_exposure += value
+        else:
+            self._active_sells[cl_ord_id] = order
+            self._sell_exposure += value
+        self._order_exposure[cl_ord_id] = value
+
+    def _unindex_order(self, cl_ord_id: str) -> None:
+        """Remove an order from its side index and exposure.
+
+        Args:
+            cl_ord_id: Client order ID
+        """
+        value = self._order_exposure.pop(cl_ord_id, None)
+        if value is None:
+            return
+        if self._active_buys.pop(cl_ord_id, None) is not None:
+            self._buy_exposure -= value
+        elif self._active_sells.pop(cl_ord_id, None) is not None:
+            self._sell_exposure -= value
+
+    def refresh_order(self, order: StrategyOrder) -> None:
+        """Re-index a tracked order after its price, size or state changed.
+
+        Args:
+            order: Strategy order that was updated in place
+        """
+        self._unindex_order(order.cl_ord_id)
+        if order.cl_ord_id in self.live_orders:
+            self._index_order(order)
+            self.order_seq += 1
+
     def add_order(self, order: StrategyOrder) -> None:
         """Add a strategy order to tracking.
 
         Args:
             order: Strategy order to track
         """
+        self._unindex_order(order.cl_ord_id)
         self.live_orders[order.cl_ord_id] = order
+        self._index_order(order)
+        self.order_seq += 1
 
     def get_order(self, cl_ord_id: str) -> StrategyOrder | None:
         """Get a tracked order by client order ID.
@@ -362,43 +666,73 @@ class MarketContext:
         Returns:
             Removed order or None if not found
         """
-        return self.live_orders.pop(cl_ord_id, None)
+        self._unindex_order(cl_ord_id)
+        order = self.live_orders.pop(cl_ord_id, None)
+        if order is not None:
+            self.order_seq += 1
+        return order
 
-    def record_fill(self, side: str, size: Decimal) -> None:
+    def record_fill(self, side: Side | str, size: Decimal) -> None:
         """Record a fill for position tracking.
 
         Args:
-            side: "buy" or "sell"
+            side: Side.BUY or Side.SELL
             size: Fill size
         """
-        if side == "buy":
+        if side == Side.BUY:
             self.net_filled_buy += size
         else:
             self.net_filled_sell += size
 
-    def clear_terminal_orders(self) -> int:
-        """Remove all filled/canceled orders from tracking.
+    def clear_terminal_orders(self, updated_before_ns: int | None = None) -> int:
+        """Remove filled/canceled orders from tracking.
+
+        Args:
+            updated_before_ns: Only remove orders last updated before this
+                epoch-nanosecond time (None removes all terminal orders)
 
         Returns:
             Number of orders removed
         """
-        from samples.okx_market_maker.domain.enums import OrderState
-
-        terminal_states = {OrderState.FILLED, OrderState.CANCELED, OrderState.REJECTED}
+        if not self.live_orders:
+            return 0
+        # Collect first, then delete in place (no rebuilt dict)
         to_remove = [
             cl_ord_id for cl_ord_id, order in self.live_orders.items()
-            if order.state in terminal_states
+            if order.state.flag & TERMINAL_STATE_MASK
+            and (updated_before_ns is None or order.updated_at < updated_before_ns)
         ]
         for cl_ord_id in to_remove:
             del self.live_orders[cl_ord_id]
+            self._unindex_order(cl_ord_id)
+        if to_remove:
+            self.order_seq += 1
         return len(to_remove)
 
     # --- Volatility Calculation ---
 
+    @property
+    def recent_prices(self) -> tuple[Decimal, ...]:
+        """Get the recent mid-price history, oldest first (read-only copy)."""
+        return tuple(self._recent_prices)
+
+    @recent_prices.setter
+    def recent_prices(self, prices: Iterable[Decimal]) -> None:
+        """Replace the mid-price history, keeping the newest max_price_history."""
+        self._recent_prices.clear()
+        self._recent_prices.extend(prices)
+        self.price_seq += 1
+
     def calculate_volatility(self, lookback: int = 20) -> Decimal | None:
         """Calculate recent price volatility.
 
-        Uses standard deviation of price returns.
+        Uses standard deviation of price returns. Computed in float since
+        the result only sizes spreads and is not used for accounting; the
+        result is converted to Decimal once per recomputation.
+
+        The last result is reused until the price history changes, so
+        strategies can call this from both quoting and halt checks, and
+        book updates that leave the mid unchanged skip the recomputation.
 
         Args:
             lookback: Number of prices to consider
@@ -406,20 +740,26 @@ class MarketContext:
         Returns:
             Volatility as decimal, or None if insufficient data
         """
-        if len(self.recent_prices) < lookback + 1:
-            return None
-
-        prices = self.recent_prices[-lookback - 1:]
-        returns = [
-            (prices[i] - prices[i - 1]) / prices[i - 1]
-            for i in range(1, len(prices))
-        ]
-
-        if not returns:
-            return None
-
-        mean_return = sum(returns) / len(returns)
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-
-        # Return standard deviation
-        return Decimal(str(variance)).sqrt()
+        key = (lookback, self.price_seq)
+        if key == self._volatility_key:
+            return self._volatility
+
+        recent_prices = self._recent_prices
+        num_prices = len(recent_prices)
+        volatility = None
+        if num_prices >= lookback + 1:
+            prices = [
+                float(p) for p in islice(recent_prices, num_prices - lookback - 1, None)
+            ]
+            returns = [(cur - prev) / prev for prev, cur in pairwise(prices)]
+
+            if returns:
+                mean_return = sum(returns) / len(returns)
+                deviations = [r - mean_return for r in returns]
+                variance = sum(map(operator.mul, deviations, deviations)) / len(returns)
+                # Standard deviation
+                volatility = Decimal(str(math.sqrt(variance)))
+
+        self._volatility_key = key
+        self._volatility = volatility
+        return volatility
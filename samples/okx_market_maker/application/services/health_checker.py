@@ -5,6 +5,7 @@ Monitors data freshness and system health.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -14,7 +15,7 @@ if TYPE_CHECKING:
     from samples.okx_market_maker.core.config.settings import MarketMakerSettings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HealthStatus:
     """System health status.
 
@@ -24,7 +25,7 @@ class HealthStatus:
         account_ok: Account data is fresh
         position_ok: Position data is fresh
         connection_ok: WebSocket connections are alive
-        issues: List of health issues
+        issues: Health issues (empty when healthy)
     """
 
     is_healthy: bool
@@ -32,7 +33,33 @@ class HealthStatus:
     account_ok: bool
     position_ok: bool
     connection_ok: bool
-    issues: list[str]
+    issues: tuple[str, ...]
+
+
+# Shared issues value for healthy checks
+_NO_ISSUES: tuple[str, ...] = ()
+
+
+class _Counter:
+    """Single-writer counter whose value can be read from other threads.
+
+    Only the health check loop writes to it; readers (metrics, monitoring)
+    load `value`, which is a single attribute read and needs no lock.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        """Initialize counter at zero."""
+        self.value = 0
+
+    def increment(self) -> None:
+        """Add one to the counter."""
+        self.value += 1
+
+    def reset(self) -> None:
+        """Set the counter back to zero."""
+        self.value = 0
 
 
 class HealthChecker:
@@ -59,8 +86,18 @@ class HealthChecker:
             settings: Market maker configuration
         """
         self.settings = settings
+        self._orderbook_max_age = settings.orderbook_max_delay_sec
+        self._account_max_age = settings.account_max_delay_sec
+        self._position_max_age = settings.position_max_delay_sec
         self._last_check_time: datetime | None = None
-        self._consecutive_failures = 0
+        self._consecutive_failures = _Counter()
+
+        # Memoized result for one context, reused until _cached_until while
+        # no update arrives
+        self._cached_status: HealthStatus | None = None
+        self._cached_context: MarketContext | None = None
+        self._cached_until = 0.0
+        self._cached_key: tuple | None = None
 
     def check(
         self,
@@ -69,6 +106,12 @@ class HealthChecker:
     ) -> HealthStatus:
         """Perform health check.
 
+        If the same context has had no update since the last check, the
+        previous HealthStatus is returned as-is. A healthy status is reused
+        until its data would first go stale; an unhealthy one for
+        health_check_min_interval_sec, and every call that reuses it still
+        counts as a consecutive failure.
+
         Args:
             context: Current market context
             check_connection: Whether to check connection status
@@ -76,58 +119,61 @@ class HealthChecker:
         Returns:
             HealthStatus with check results
         """
-        issues: list[str] = []
-        self._last_check_time = datetime.now(UTC)
-
-        # Check orderbook freshness
-        orderbook_ok = context.is_orderbook_fresh(
-            self.settings.orderbook_max_delay_sec
+        # Read the clock once and share it across all freshness checks
+        now = time.monotonic()
+
+        key = (
+            context.orderbook_seq,
+            context.account_seq,
+            context.position_seq,
+            check_connection,
         )
-        if not orderbook_ok:
-            age = self._calculate_age(context.orderbook_time)
-            issues.append(f"Orderbook stale: {age:.1f}s old")
+        status = self._cached_status
+        if (
+            status is not None
+            and context is self._cached_context
+            and now < self._cached_until
+            and key == self._cached_key
+        ):
+            if not status.is_healthy:
+                self._consecutive_failures.increment()
+            return status
 
-        # Check account freshness
-        account_ok = context.is_account_fresh(
-            self.settings.account_max_delay_sec
-        )
-        if not account_ok:
-            age = self._calculate_age(context.account_time)
-            issues.append(f"Account data stale: {age:.1f}s old")
+        self._last_check_time = datetime.now(UTC)
 
-        # Check position freshness
-        position_ok = context.is_position_fresh(
-            self.settings.position_max_delay_sec
+        orderbook_fresh, account_ok, position_ok = context.freshness_snapshot(
+            self._orderbook_max_age,
+            self._account_max_age,
+            self._position_max_age,
+            now,
         )
-        if not position_ok:
-            age = self._calculate_age(context.position_time)
-            issues.append(f"Position data stale: {age:.1f}s old")
 
         # Check connection (simplified - assumes ok if we have recent data)
         connection_ok = True
         if check_connection:
-            connection_ok = orderbook_ok or account_ok
-            if not connection_ok:
-                issues.append("No recent data - connection may be lost")
+            connection_ok = orderbook_fresh or account_ok
 
-        # Check for missing essential data
-        if context.orderbook is None:
-            issues.append("No orderbook data")
-            orderbook_ok = False
-
-        if context.mid_price is None:
-            issues.append("Cannot calculate mid price")
+        # Missing essential data counts as an orderbook failure
+        has_orderbook = context.orderbook is not None
+        orderbook_ok = orderbook_fresh and has_orderbook
 
         # Overall health
         is_healthy = orderbook_ok and account_ok and position_ok and connection_ok
 
+        # Only format issue messages when something is wrong
+        issues = _NO_ISSUES
+        if not is_healthy or context.mid_price is None:
+            issues = self._describe_issues(
+                context, now, orderbook_fresh, account_ok, position_ok, connection_ok
+            )
+
         # Track consecutive failures
         if is_healthy:
-            self._consecutive_failures = 0
+            self._consecutive_failures.reset()
         else:
-            self._consecutive_failures += 1
+            self._consecutive_failures.increment()
 
-        return HealthStatus(
+        status = HealthStatus(
             is_healthy=is_healthy,
             orderbook_ok=orderbook_ok,
             account_ok=account_ok,
@@ -136,23 +182,68 @@ class HealthChecker:
             issues=issues,
         )
 
-    def _calculate_age(self, timestamp: datetime | None) -> float:
-        """Calculate age of data in seconds.
+        self._cached_status = status
+        self._cached_context = context
+        self._cached_key = key
+        if is_healthy:
+            # Nothing can change until an update arrives or data ages out
+            self._cached_until = context.fresh_until(
+                self._orderbook_max_age,
+                self._account_max_age,
+                self._position_max_age,
+            )
+        else:
+            self._cached_until = now + self.settings.health_check_min_interval_sec
+        return status
+
+    def _describe_issues(
+        self,
+        context: MarketContext,
+        now: float,
+        orderbook_fresh: bool,
+        account_ok: bool,
+        position_ok: bool,
+        connection_ok: bool,
+    ) -> tuple[str, ...]:
+        """Build human-readable messages for failed checks.
 
         Args:
-            timestamp: Data timestamp
+            context: Current market context
+            now: Monotonic time the checks were evaluated at
+            orderbook_fresh: Orderbook freshness result
+            account_ok: Account freshness result
+            position_ok: Position freshness result
+            connection_ok: Connection check result
 
         Returns:
-            Age in seconds, or inf if no timestamp
+            Tuple of health issues
         """
-        if timestamp is None:
-            return float("inf")
-        return (datetime.now(UTC) - timestamp).total_seconds()
+        issues: list[str] = []
+
+        if not orderbook_fresh:
+            issues.append(f"Orderbook stale: {context.orderbook_age(now):.1f}s old")
+
+        if not account_ok:
+            issues.append(f"Account data stale: {context.account_age(now):.1f}s old")
+
+        if not position_ok:
+            issues.append(f"Position data stale: {context.position_age(now):.1f}s old")
+
+        if not connection_ok:
+            issues.append("No recent data - connection may be lost")
+
+        if context.orderbook is None:
+            issues.append("No orderbook data")
+
+        if context.mid_price is None:
+            issues.append("Cannot calculate mid price")
+
+        return tuple(issues)
 
     @property
     def consecutive_failures(self) -> int:
         """Get number of consecutive health check failures."""
-        return self._consecutive_failures
+        return self._consecutive_failures.value
 
     @property
     def last_check_time(self) -> datetime | None:
@@ -168,4 +259,4 @@ class HealthChecker:
         Returns:
             True if emergency stop should be triggered
         """
-        return self._consecutive_failures >= threshold
+        return self._consecutive_failures.value >= threshold
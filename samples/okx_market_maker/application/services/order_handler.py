@@ -5,32 +5,49 @@ Manages order lifecycle including placement, cancellation, and state updates.
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 from client_gw_core import get_logger
 
+from okx_client_gw.domain.enums import OrderType, TradeMode, TradeSide
+from okx_client_gw.domain.models.order import OrderRequest
 from samples.okx_market_maker.core.utils.id_generator import OrderIdGenerator
-from samples.okx_market_maker.domain.enums import OrderState
+from samples.okx_market_maker.domain.enums import TERMINAL_STATE_MASK, OrderState, Side
 from samples.okx_market_maker.domain.models.amend_request import AmendRequest
 from samples.okx_market_maker.domain.models.quote import Quote, StrategyDecision
 from samples.okx_market_maker.domain.models.strategy_order import StrategyOrder
 
 if TYPE_CHECKING:
     from okx_client_gw.application.services.trade_service import TradeService
-    from okx_client_gw.domain.models.order import Order, OrderRequest
+    from okx_client_gw.domain.models.order import Order
     from samples.okx_market_maker.application.context.market_context import MarketContext
     from samples.okx_market_maker.core.config.settings import MarketMakerSettings
 
 
 logger = get_logger(__name__)
 
+# Strategy side -> API trade side, without an enum lookup per order
+_TRADE_SIDES = {Side.BUY: TradeSide.BUY, Side.SELL: TradeSide.SELL}
+
+# Exchange states after which no further pushes (or fills) arrive for an order
+_FINAL_PUSH_STATES = frozenset({"filled", "canceled", "mmp_canceled"})
+
+# Log line for each terminal state an exchange update can report
+_TERMINAL_LOGS = {
+    OrderState.FILLED: "Order filled: %s",
+    OrderState.CANCELED: "Order canceled: %s",
+}
+
 
 class OrderHandler:
     """Handles order placement, cancellation, and state management.
 
     Responsibilities:
     - Convert strategy decisions to API calls
-    - Batch order operations (max 20 per request)
+    - Batch order operations (max 20 per request, max_concurrent_batches in flight)
     - Track order state in context
     - Handle order updates from WebSocket
 
@@ -66,15 +83,33 @@ class OrderHandler:
         self._settings = settings
         self._context = context
         self._id_generator = OrderIdGenerator(prefix="mm")
+        # Identifies this run's orders once they are no longer tracked
+        self._own_id_prefix = self._id_generator.prefix + self._id_generator.session
+        self._trade_mode = TradeMode(settings.trading_mode)
+        # Bounds batch requests in flight across all groups
+        self._batch_semaphore = asyncio.Semaphore(settings.max_concurrent_batches)
 
     async def execute_decision(self, decision: StrategyDecision) -> None:
         """Execute a strategy decision.
 
         Places new orders, amends existing orders, cancels unwanted orders.
+        Groups run in order (cancel, amend, place) so freed margin is
+        available to new orders; the batches within a group are sent
+        concurrently. With concurrent_cancel_place set, all three groups
+        are sent together, saving two round trips when margin allows.
 
         Args:
             decision: Strategy decision to execute
         """
+        if self._settings.concurrent_cancel_place:
+            # New orders get fresh client IDs, so they never collide with cancels
+            await asyncio.gather(
+                self._cancel_orders(decision.orders_to_cancel),
+                self._amend_orders(decision.orders_to_amend),
+                self._place_orders(decision.orders_to_place),
+            )
+            return
+
         # First cancel orders
         if decision.orders_to_cancel:
             await self._cancel_orders(decision.orders_to_cancel)
@@ -87,7 +122,7 @@ class OrderHandler:
         if decision.orders_to_place:
             await self._place_orders(decision.orders_to_place)
 
-    async def _place_orders(self, quotes: list[Quote]) -> None:
+    async def _place_orders(self, quotes: Sequence[Quote]) -> None:
         """Place orders from quotes.
 
         Batches orders up to MAX_BATCH_SIZE per request.
@@ -95,9 +130,6 @@ class OrderHandler:
         Args:
             quotes: Quotes to place as orders
         """
-        from okx_client_gw.domain.enums import OrderType, TradeMode, TradeSide
-        from okx_client_gw.domain.models.order import OrderRequest
-
         if not quotes:
             return
 
@@ -105,7 +137,8 @@ class OrderHandler:
         order_requests: list[OrderRequest] = []
         strategy_orders: list[StrategyOrder] = []
 
-        trade_mode = TradeMode(self._settings.trading_mode)
+        inst_id = self._settings.inst_id
+        trade_mode = self._trade_mode
 
         for quote in quotes:
             cl_ord_id = self._id_generator.next()
@@ -113,7 +146,7 @@ class OrderHandler:
             # Create strategy order for tracking
             strategy_order = StrategyOrder(
                 cl_ord_id=cl_ord_id,
-                inst_id=self._settings.inst_id,
+                inst_id=inst_id,
                 side=quote.side,
                 price=quote.price,
                 size=quote.size,
@@ -122,9 +155,9 @@ class OrderHandler:
 
             # Create API order request
             order_request = OrderRequest(
-                inst_id=self._settings.inst_id,
+                inst_id=inst_id,
                 td_mode=trade_mode,
-                side=TradeSide(quote.side.upper()),
+                side=_TRADE_SIDES[quote.side],
                 ord_type=OrderType.LIMIT,
                 sz=quote.size,
                 px=quote.price,
@@ -136,43 +169,60 @@ class OrderHandler:
         for strategy_order in strategy_orders:
             self._context.add_order(strategy_order)
 
-        # Place in batches
-        for i in range(0, len(order_requests), self.MAX_BATCH_SIZE):
-            batch = order_requests[i : i + self.MAX_BATCH_SIZE]
-            batch_strategy = strategy_orders[i : i + self.MAX_BATCH_SIZE]
+        # Place in batches, sent concurrently up to max_concurrent_batches
+        await asyncio.gather(*(
+            self._place_batch(
+                order_requests[i : i + self.MAX_BATCH_SIZE],
+                strategy_orders[i : i + self.MAX_BATCH_SIZE],
+            )
+            for i in range(0, len(order_requests), self.MAX_BATCH_SIZE)
+        ))
+
+    async def _place_batch(
+        self,
+        batch: list[OrderRequest],
+        batch_strategy: list[StrategyOrder],
+    ) -> None:
+        """Place one batch of orders and apply the per-order results.
 
-            try:
-                # Mark as sent
+        Args:
+            batch: Order requests (at most MAX_BATCH_SIZE)
+            batch_strategy: Strategy orders matching batch by position
+        """
+        try:
+            async with self._batch_semaphore:
+                # Mark as sent once the batch actually goes out
                 for so in batch_strategy:
                     so.mark_sent()
 
                 # Place batch
                 results = await self._trade_service.place_batch_orders(batch)
 
-                # Process results
-                for j, result in enumerate(results):
-                    so = batch_strategy[j]
-                    if result.get("sCode") == "0":
-                        ord_id = result.get("ordId", "")
-                        so.mark_ack(ord_id)
-                        logger.info(
-                            f"Order placed: {so.cl_ord_id} -> {ord_id} "
-                            f"{so.side} {so.size}@{so.price}"
-                        )
-                    else:
-                        error_msg = result.get("sMsg", "Unknown error")
-                        so.mark_rejected(error_msg)
-                        logger.warning(
-                            f"Order rejected: {so.cl_ord_id} - {error_msg}"
-                        )
-
-            except Exception as e:
-                logger.error(f"Failed to place batch: {e}")
-                for so in batch_strategy:
-                    if so.state == OrderState.SENT:
-                        so.mark_rejected(str(e))
-
-    async def _cancel_orders(self, cl_ord_ids: list[str]) -> None:
+            # Process results
+            for j, result in enumerate(results):
+                so = batch_strategy[j]
+                if result.get("sCode") == "0":
+                    ord_id = result.get("ordId", "")
+                    so.mark_ack(ord_id)
+                    # Per-order logs use lazy %-args so they cost nothing when filtered
+                    logger.info(
+                        "Order placed: %s -> %s %s %s@%s",
+                        so.cl_ord_id, ord_id, so.side, so.size, so.price,
+                    )
+                else:
+                    error_msg = result.get("sMsg", "Unknown error")
+                    so.mark_rejected(error_msg)
+                    self._context.remove_order(so.cl_ord_id)
+                    logger.warning("Order rejected: %s - %s", so.cl_ord_id, error_msg)
+
+        except Exception as e:
+            logger.error("Failed to place batch: %s", e)
+            for so in batch_strategy:
+                if so.state is OrderState.SENT:
+                    so.mark_rejected(str(e))
+                    self._context.remove_order(so.cl_ord_id)
+
+    async def _cancel_orders(self, cl_ord_ids: Sequence[str]) -> None:
         """Cancel orders by client order ID.
 
         Args:
@@ -194,31 +244,41 @@ class OrderHandler:
         if not cancel_requests:
             return
 
-        # Cancel in batches
-        for i in range(0, len(cancel_requests), self.MAX_BATCH_SIZE):
-            batch = cancel_requests[i : i + self.MAX_BATCH_SIZE]
-
-            try:
-                results = await self._trade_service.cancel_batch_orders(batch)
+        # Cancel in batches, sent concurrently
+        await asyncio.gather(*(
+            self._cancel_batch(cancel_requests[i : i + self.MAX_BATCH_SIZE])
+            for i in range(0, len(cancel_requests), self.MAX_BATCH_SIZE)
+        ))
 
-                for j, result in enumerate(results):
-                    cl_ord_id = batch[j]["clOrdId"]
-                    order = self._context.get_order(cl_ord_id)
+    async def _cancel_batch(self, batch: list[dict[str, str]]) -> None:
+        """Cancel one batch of orders and apply the per-order results.
 
-                    if result.get("sCode") == "0":
-                        if order:
-                            order.mark_canceled()
-                        logger.info(f"Order canceled: {cl_ord_id}")
-                    else:
-                        error_msg = result.get("sMsg", "Unknown error")
-                        logger.warning(
-                            f"Cancel failed for {cl_ord_id}: {error_msg}"
-                        )
-
-            except Exception as e:
-                logger.error(f"Failed to cancel batch: {e}")
+        Args:
+            batch: Cancel requests (at most MAX_BATCH_SIZE)
+        """
+        try:
+            async with self._batch_semaphore:
+                results = await self._trade_service.cancel_batch_orders(batch)
 
-    async def _amend_orders(self, amend_requests: list[AmendRequest]) -> None:
+            for j, result in enumerate(results):
+                cl_ord_id = batch[j]["clOrdId"]
+                order = self._context.get_order(cl_ord_id)
+
+                if result.get("sCode") == "0":
+                    if order:
+                        # Still tracked until the final push: a fill can
+                        # race the cancel and must reach the position
+                        order.mark_canceled()
+                        self._context.refresh_order(order)
+                    logger.info("Order canceled: %s", cl_ord_id)
+                else:
+                    error_msg = result.get("sMsg", "Unknown error")
+                    logger.warning("Cancel failed for %s: %s", cl_ord_id, error_msg)
+
+        except Exception as e:
+            logger.error("Failed to cancel batch: %s", e)
+
+    async def _amend_orders(self, amend_requests: Sequence[AmendRequest]) -> None:
         """Amend existing orders.
 
         Batches amend requests up to MAX_BATCH_SIZE per request.
@@ -235,46 +295,55 @@ class OrderHandler:
             if order and order.is_active:
                 order.mark_amending()
 
-        # Amend in batches
-        for i in range(0, len(amend_requests), self.MAX_BATCH_SIZE):
-            batch = amend_requests[i : i + self.MAX_BATCH_SIZE]
-            batch_dicts = [amend.to_okx_dict() for amend in batch]
+        # Amend in batches, sent concurrently
+        await asyncio.gather(*(
+            self._amend_batch(amend_requests[i : i + self.MAX_BATCH_SIZE])
+            for i in range(0, len(amend_requests), self.MAX_BATCH_SIZE)
+        ))
+
+    async def _amend_batch(self, batch: Sequence[AmendRequest]) -> None:
+        """Amend one batch of orders and apply the per-order results.
+
+        Args:
+            batch: Amend requests (at most MAX_BATCH_SIZE)
+        """
+        batch_dicts = [amend.to_okx_dict() for amend in batch]
 
-            try:
+        try:
+            async with self._batch_semaphore:
                 results = await self._trade_service.amend_batch_orders(batch_dicts)
 
-                for j, result in enumerate(results):
-                    amend = batch[j]
-                    cl_ord_id = amend.cl_ord_id
-                    order = self._context.get_order(cl_ord_id) if cl_ord_id else None
-
-                    if result.get("sCode") == "0":
-                        if order:
-                            # Update order with new values
-                            if amend.new_px is not None:
-                                order.price = amend.new_px
-                            if amend.new_sz is not None:
-                                order.size = amend.new_sz
-                            order.mark_live()
-                        logger.info(
-                            f"Order amended: {cl_ord_id} "
-                            f"new_px={amend.new_px} new_sz={amend.new_sz}"
-                        )
-                    else:
-                        error_msg = result.get("sMsg", "Unknown error")
-                        if order:
-                            order.mark_live()  # Revert to live state
-                        logger.warning(
-                            f"Amend failed for {cl_ord_id}: {error_msg}"
-                        )
-
-            except Exception as e:
-                logger.error(f"Failed to amend batch: {e}")
-                # Revert orders to live state
-                for amend in batch:
-                    order = self._context.get_order(amend.cl_ord_id) if amend.cl_ord_id else None
-                    if order and order.state == OrderState.AMENDING:
+            for j, result in enumerate(results):
+                amend = batch[j]
+                cl_ord_id = amend.cl_ord_id
+                order = self._context.get_order(cl_ord_id) if cl_ord_id else None
+
+                if result.get("sCode") == "0":
+                    if order:
+                        # Update order with new values
+                        if amend.new_px is not None:
+                            order.price = amend.new_px
+                        if amend.new_sz is not None:
+                            order.size = amend.new_sz
                         order.mark_live()
+                        self._context.refresh_order(order)
+                    logger.info(
+                        "Order amended: %s new_px=%s new_sz=%s",
+                        cl_ord_id, amend.new_px, amend.new_sz,
+                    )
+                else:
+                    error_msg = result.get("sMsg", "Unknown error")
+                    if order:
+                        order.mark_live()  # Revert to live state
+                    logger.warning("Amend failed for %s: %s", cl_ord_id, error_msg)
+
+        except Exception as e:
+            logger.error("Failed to amend batch: %s", e)
+            # Revert orders to live state
+            for amend in batch:
+                order = self._context.get_order(amend.cl_ord_id) if amend.cl_ord_id else None
+                if order and order.state is OrderState.AMENDING:
+                    order.mark_live()
 
     async def cancel_all(self) -> int:
         """Cancel all active orders.
@@ -308,7 +377,16 @@ class OrderHandler:
 
         strategy_order = self._context.get_order(cl_ord_id)
         if not strategy_order:
-            logger.debug(f"Unknown order update: {cl_ord_id}")
+            if order_data.fill_sz > 0 and cl_ord_id.startswith(self._own_id_prefix):
+                # One of ours, already swept: the position must still count it
+                self._context.record_fill(side=order_data.side.value, size=order_data.fill_sz)
+                logger.warning(
+                    "Fill for untracked order: %s %s %s@%s",
+                    cl_ord_id, order_data.side.value, order_data.fill_sz, order_data.fill_px,
+                )
+                return
+            # Lazy args: debug is normally filtered and this runs per update
+            logger.debug("Unknown order update: %s", cl_ord_id)
             return
 
         # Update from exchange
@@ -326,20 +404,30 @@ class OrderHandler:
                 size=order_data.fill_sz,
             )
             logger.info(
-                f"Fill: {cl_ord_id} {strategy_order.side} "
-                f"{order_data.fill_sz}@{order_data.fill_px}"
+                "Fill: %s %s %s@%s",
+                cl_ord_id, strategy_order.side, order_data.fill_sz, order_data.fill_px,
             )
 
-        # Log state changes
-        if strategy_order.is_filled:
-            logger.info(f"Order filled: {cl_ord_id}")
-        elif strategy_order.is_canceled:
-            logger.info(f"Order canceled: {cl_ord_id}")
+        # Terminal orders log their outcome and stop being tracked on the
+        # final push; an order canceled over REST can still report fills
+        # before it. Live updates (the common case) take one mask test.
+        state = strategy_order.state
+        if state.flag & TERMINAL_STATE_MASK and order_data.state.value in _FINAL_PUSH_STATES:
+            message = _TERMINAL_LOGS.get(state)
+            if message is not None:
+                logger.info(message, cl_ord_id)
+            self._context.remove_order(cl_ord_id)
 
     def cleanup_terminal_orders(self) -> int:
-        """Remove terminal orders from tracking.
+        """Remove terminal orders that outlived the grace period.
+
+        Orders are dropped on their final exchange push, so this only
+        sweeps orders whose final push never arrived, or that transitioned
+        outside the handler. Fills for swept orders are still counted by
+        on_order_update.
 
         Returns:
             Number of orders removed
         """
-        return self._context.clear_terminal_orders()
+        grace_ns = int(self._settings.terminal_order_grace_sec * 1_000_000_000)
+        return self._context.clear_terminal_orders(updated_before_ns=time.time_ns() - grace_ns)
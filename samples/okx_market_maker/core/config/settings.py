@@ -2,11 +2,15 @@
 
 Supports configuration from YAML file and environment variable overrides.
 Environment variables use MM_ prefix (e.g., MM_INST_ID, MM_STEP_PCT).
+
+Order sizes and risk limits are Decimal since they reach the exchange or
+are compared against fills; strategy tuning ratios are plain floats.
 """
 
 from __future__ import annotations
 
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -14,6 +18,12 @@ import yaml
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    # LibYAML C parser when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class MarketMakerSettings(BaseSettings):
     """Market maker configuration settings.
@@ -65,8 +75,8 @@ class MarketMakerSettings(BaseSettings):
         default="grid",
         description="Strategy type to use",
     )
-    step_pct: Decimal = Field(
-        default=Decimal("0.001"),
+    step_pct: float = Field(
+        default=0.001,
         description="Price step between orders as percentage (0.001 = 0.1%)",
     )
     num_orders_per_side: int = Field(
@@ -79,8 +89,8 @@ class MarketMakerSettings(BaseSettings):
         default=Decimal("0.001"),
         description="Size for each individual order",
     )
-    single_order_size_multiplier: Decimal = Field(
-        default=Decimal("1.0"),
+    single_order_size_multiplier: float = Field(
+        default=1.0,
         description="Multiplier applied to order size",
     )
 
@@ -111,20 +121,52 @@ class MarketMakerSettings(BaseSettings):
         default=10.0,
         description="Maximum position data staleness in seconds",
     )
+    health_check_min_interval_sec: float = Field(
+        default=0.5,
+        description="Minimum interval before a health check is recomputed",
+    )
 
     # Main loop settings
     main_loop_interval_sec: float = Field(
         default=1.0,
         description="Interval between strategy iterations",
     )
+    requote_move_pct: float | None = Field(
+        default=None,
+        description="Mid move since the last iteration that triggers an early one (None disables)",
+    )
+    log_interval_sec: float = Field(
+        default=5.0,
+        description="Minimum interval between status log lines",
+    )
+    debug_checks: bool = Field(
+        default=False,
+        description="Assert order-tracking invariants every iteration (debug only, O(N))",
+    )
+
+    # Order execution settings
+    concurrent_cancel_place: bool = Field(
+        default=False,
+        description="Send cancels, amends and places together instead of cancels first",
+    )
+    max_concurrent_batches: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum batch requests in flight at once",
+    )
+    terminal_order_grace_sec: float = Field(
+        default=30.0,
+        gt=0,
+        description="How long canceled/filled orders stay tracked for late fills",
+    )
 
     # Inventory skew strategy settings
-    skew_factor: Decimal = Field(
-        default=Decimal("0.5"),
+    skew_factor: float = Field(
+        default=0.5,
         description="How aggressively to skew prices based on inventory (0-1)",
     )
-    max_skew_pct: Decimal = Field(
-        default=Decimal("0.005"),
+    max_skew_pct: float = Field(
+        default=0.005,
         description="Maximum price skew as percentage (0.005 = 0.5%)",
     )
 
@@ -133,16 +175,16 @@ class MarketMakerSettings(BaseSettings):
         default=20,
         description="Number of candles for volatility calculation",
     )
-    volatility_multiplier: Decimal = Field(
-        default=Decimal("2.0"),
+    volatility_multiplier: float = Field(
+        default=2.0,
         description="Multiplier for volatility-based spread",
     )
-    min_spread_pct: Decimal = Field(
-        default=Decimal("0.001"),
+    min_spread_pct: float = Field(
+        default=0.001,
         description="Minimum spread percentage",
     )
-    max_spread_pct: Decimal = Field(
-        default=Decimal("0.01"),
+    max_spread_pct: float = Field(
+        default=0.01,
         description="Maximum spread percentage",
     )
 
@@ -159,7 +201,7 @@ class MarketMakerSettings(BaseSettings):
         yaml_path = Path(yaml_path)
         if yaml_path.exists():
             with open(yaml_path) as f:
-                yaml_config = yaml.safe_load(f) or {}
+                yaml_config = yaml.load(f, Loader=_YamlLoader) or {}
             return cls(**yaml_config)
         return cls()
 
@@ -173,13 +215,41 @@ class MarketMakerSettings(BaseSettings):
         """Load settings from default params.yaml with env overrides.
 
         Convenience method that loads from the default params.yaml location.
+        The result is cached; use reload() to re-read the file and environment.
 
         Returns:
             MarketMakerSettings instance
         """
-        return cls.from_yaml(cls.default_yaml_path())
+        return _load_settings(cls, cls.default_yaml_path())
+
+    @classmethod
+    def reload(cls) -> MarketMakerSettings:
+        """Clear the load() cache and load settings again.
+
+        Returns:
+            Freshly loaded MarketMakerSettings instance
+        """
+        _load_settings.cache_clear()
+        return cls.load()
 
     @property
     def effective_order_size(self) -> Decimal:
         """Calculate effective order size with multiplier."""
-        return self.single_order_size * self.single_order_size_multiplier
+        return self.single_order_size * Decimal(str(self.single_order_size_multiplier))
+
+
+@lru_cache(maxsize=4)
+def _load_settings(
+    settings_cls: type[MarketMakerSettings],
+    yaml_path: Path,
+) -> MarketMakerSettings:
+    """Load and cache settings for a settings class and YAML path.
+
+    Args:
+        settings_cls: Settings class to instantiate
+        yaml_path: Path to YAML configuration file
+
+    Returns:
+        Settings instance shared by later calls with the same arguments
+    """
+    return settings_cls.from_yaml(yaml_path)
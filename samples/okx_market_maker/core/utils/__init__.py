@@ -5,7 +5,9 @@ from samples.okx_market_maker.core.utils.id_generator import (
     generate_client_order_id,
 )
 from samples.okx_market_maker.core.utils.instrument_util import (
+    Quantizer,
     calculate_tick_precision,
+    get_quantizer,
     price_distance_pct,
     round_price_to_tick,
     round_size_to_lot,
@@ -13,8 +15,10 @@ from samples.okx_market_maker.core.utils.instrument_util import (
 
 __all__ = [
     "OrderIdGenerator",
+    "Quantizer",
     "calculate_tick_precision",
     "generate_client_order_id",
+    "get_quantizer",
     "price_distance_pct",
     "round_price_to_tick",
     "round_size_to_lot",
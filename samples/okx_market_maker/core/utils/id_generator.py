@@ -5,15 +5,51 @@ Generates unique client order IDs for tracking orders.
 
 from __future__ import annotations
 
+import os
+import secrets
 import time
-import uuid
 from collections.abc import Iterator
 
+# Random bytes drawn per os.urandom call for generate_client_order_id
+_ENTROPY_BYTES = 4096
+
+# Pre-hexed 8-character random suffixes; refilled in bulk when exhausted
+_suffixes: Iterator[str] = iter(())
+
+
+def _random_suffix() -> str:
+    """Get the next 8 random hex characters from the bulk entropy buffer.
+
+    Returns:
+        Random 8-character lowercase hex string
+    """
+    global _suffixes
+    try:
+        return next(_suffixes)
+    except StopIteration:
+        entropy = os.urandom(_ENTROPY_BYTES).hex()
+        _suffixes = iter([entropy[i:i + 8] for i in range(0, len(entropy), 8)])
+        return next(_suffixes)
+
+
+def _discard_suffixes() -> None:
+    """Drop buffered suffixes so a forked child draws its own entropy."""
+    global _suffixes
+    _suffixes = iter(())
+
+
+# A forked child would otherwise replay the parent's buffered suffixes
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_discard_suffixes)
+
 
 def generate_client_order_id(prefix: str = "mm") -> str:
     """Generate a unique client order ID.
 
-    Format: {prefix}_{timestamp_ms}_{uuid_short}
+    Format: {prefix}_{timestamp_ms}_{random_hex8}
+
+    The random part comes from one bulk os.urandom read shared by many
+    calls instead of a full uuid4 per ID.
 
     Args:
         prefix: Prefix for the ID (default: "mm")
@@ -25,30 +61,36 @@ def generate_client_order_id(prefix: str = "mm") -> str:
         >>> generate_client_order_id()
         'mm_1704067200000_a1b2c3d4'
     """
-    timestamp_ms = int(time.time() * 1000)
-    uuid_short = uuid.uuid4().hex[:8]
-    return f"{prefix}_{timestamp_ms}_{uuid_short}"
+    timestamp_ms = time.time_ns() // 1_000_000
+    return f"{prefix}_{timestamp_ms}_{_random_suffix()}"
 
 
 class OrderIdGenerator:
     """Sequential order ID generator.
 
-    Generates sequential IDs with prefix for easier tracking.
+    Generates sequential IDs with prefix for easier tracking. A random
+    session tag drawn once per generator keeps IDs from clashing with
+    those of an earlier run, while each call is only a counter increment.
+    IDs are alphanumeric, as OKX requires for clOrdId (max 32 chars).
+
+    Format: {prefix}{session}{counter:08x}
 
     Example:
         gen = OrderIdGenerator(prefix="mm")
-        id1 = gen.next()  # mm_000001
-        id2 = gen.next()  # mm_000002
+        id1 = gen.next()  # mm3fa85f6400000001
+        id2 = gen.next()  # mm3fa85f6400000002
     """
 
-    def __init__(self, prefix: str = "mm", start: int = 1) -> None:
+    def __init__(self, prefix: str = "mm", start: int = 1, session: str | None = None) -> None:
         """Initialize generator.
 
         Args:
             prefix: Prefix for IDs
             start: Starting sequence number
+            session: Session tag (default: 8 random hex characters)
         """
         self._prefix = prefix
+        self._session = secrets.token_hex(4) if session is None else session
         self._counter = start
 
     def next(self) -> str:
@@ -57,7 +99,7 @@ class OrderIdGenerator:
         Returns:
             Next client order ID
         """
-        order_id = f"{self._prefix}_{self._counter:06d}"
+        order_id = f"{self._prefix}{self._session}{self._counter:08x}"
         self._counter += 1
         return order_id
 
@@ -69,6 +111,16 @@ class OrderIdGenerator:
         """Get next ID via iterator protocol."""
         return self.next()
 
+    @property
+    def prefix(self) -> str:
+        """Get the prefix shared by this generator's IDs."""
+        return self._prefix
+
+    @property
+    def session(self) -> str:
+        """Get the session tag shared by this generator's IDs."""
+        return self._session
+
     @property
     def current(self) -> int:
         """Get current counter value."""
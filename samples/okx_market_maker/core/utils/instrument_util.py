@@ -5,7 +5,30 @@ Price and size rounding to tick/lot sizes.
 
 from __future__ import annotations
 
-from decimal import ROUND_DOWN, ROUND_HALF_UP, Decimal
+from dataclasses import dataclass, field
+from decimal import ROUND_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+from functools import lru_cache
+
+_ZERO = Decimal(0)
+_ONE = Decimal(1)
+
+
+@lru_cache(maxsize=32)
+def _tick_quantum(tick_size: Decimal) -> Decimal | None:
+    """Get the quantize exponent for a power-of-ten tick size.
+
+    Args:
+        tick_size: Minimum price/size increment
+
+    Returns:
+        Normalized tick (e.g. Decimal("1E-2")) if tick_size is 1 or a
+        negative power of ten, otherwise None
+    """
+    quantum = tick_size.normalize()
+    _, digits, exponent = quantum.as_tuple()
+    if digits == (1,) and isinstance(exponent, int) and exponent <= 0:
+        return quantum
+    return None
 
 
 def round_price_to_tick(
@@ -30,7 +53,11 @@ def round_price_to_tick(
     if tick_size <= 0:
         return price
 
-    return (price / tick_size).quantize(Decimal("1"), rounding=rounding) * tick_size
+    quantum = _tick_quantum(tick_size)
+    if quantum is not None:
+        return price.quantize(quantum, rounding=rounding)
+
+    return (price / tick_size).quantize(_ONE, rounding=rounding) * tick_size
 
 
 def round_size_to_lot(
@@ -55,9 +82,113 @@ def round_size_to_lot(
     if lot_size <= 0:
         return size
 
-    return (size / lot_size).quantize(Decimal("1"), rounding=rounding) * lot_size
+    quantum = _tick_quantum(lot_size)
+    if quantum is not None:
+        return size.quantize(quantum, rounding=rounding)
+
+    return (size / lot_size).quantize(_ONE, rounding=rounding) * lot_size
+
+
+@dataclass(frozen=True, slots=True)
+class Quantizer:
+    """Converts prices and sizes between Decimal and integer tick/lot counts.
+
+    Strategy math can run on int tick counts (or floats rounded to ticks)
+    and convert to Decimal only when building quotes for the exchange.
+
+    Attributes:
+        tick_size: Minimum price increment
+        lot_size: Minimum size increment
+
+    Example:
+        >>> q = Quantizer(Decimal("0.01"), Decimal("0.0001"))
+        >>> q.price_to_ticks(Decimal("100.12"))
+        10012
+        >>> q.ticks_to_price(10012)
+        Decimal('100.12')
+    """
+
+    tick_size: Decimal
+    lot_size: Decimal
+    _tick_float: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the float tick size for float-to-tick rounding."""
+        object.__setattr__(self, "_tick_float", float(self.tick_size))
+
+    def price_to_ticks(self, price: Decimal, rounding: str = ROUND_HALF_EVEN) -> int:
+        """Convert a price to the nearest whole number of ticks.
+
+        Args:
+            price: Price to convert
+            rounding: Rounding mode (default: ROUND_HALF_EVEN)
 
+        Returns:
+            Price as an integer tick count
+        """
+        return int((price / self.tick_size).to_integral_value(rounding=rounding))
 
+    def float_to_ticks(self, price: float) -> int:
+        """Convert a float price to the nearest whole number of ticks.
+
+        Args:
+            price: Price to convert
+
+        Returns:
+            Price as an integer tick count
+        """
+        return round(price / self._tick_float)
+
+    def ticks_to_price(self, ticks: int) -> Decimal:
+        """Convert an integer tick count to a Decimal price.
+
+        Args:
+            ticks: Tick count
+
+        Returns:
+            Price with the tick size's precision
+        """
+        return Decimal(ticks) * self.tick_size
+
+    def size_to_lots(self, size: Decimal, rounding: str = ROUND_DOWN) -> int:
+        """Convert a size to a whole number of lots.
+
+        Args:
+            size: Size to convert
+            rounding: Rounding mode (default: ROUND_DOWN for safety)
+
+        Returns:
+            Size as an integer lot count
+        """
+        return int((size / self.lot_size).to_integral_value(rounding=rounding))
+
+    def lots_to_size(self, lots: int) -> Decimal:
+        """Convert an integer lot count to a Decimal size.
+
+        Args:
+            lots: Lot count
+
+        Returns:
+            Size with the lot size's precision
+        """
+        return Decimal(lots) * self.lot_size
+
+
+@lru_cache(maxsize=32)
+def get_quantizer(tick_size: Decimal, lot_size: Decimal) -> Quantizer:
+    """Get the shared Quantizer for a tick/lot size pair.
+
+    Args:
+        tick_size: Minimum price increment
+        lot_size: Minimum size increment
+
+    Returns:
+        Cached Quantizer instance
+    """
+    return Quantizer(tick_size, lot_size)
+
+
+@lru_cache(maxsize=64)
 def calculate_tick_precision(tick_size: Decimal) -> int:
     """Calculate decimal precision from tick size.
 
@@ -76,12 +207,9 @@ def calculate_tick_precision(tick_size: Decimal) -> int:
     if tick_size >= 1:
         return 0
 
-    # Count decimal places
-    tick_str = str(tick_size)
-    if "." not in tick_str:
-        return 0
-
-    return len(tick_str.split(".")[1].rstrip("0"))
+    # Count significant decimal places from the normalized exponent
+    exponent = tick_size.normalize().as_tuple().exponent
+    return max(0, -exponent)
 
 
 def price_distance_pct(price1: Decimal, price2: Decimal) -> Decimal:
@@ -99,6 +227,6 @@ def price_distance_pct(price1: Decimal, price2: Decimal) -> Decimal:
         Decimal('0.01')  # 1%
     """
     if price2 == 0:
-        return Decimal("0")
+        return _ZERO
 
     return (price1 - price2) / price2
@@ -4,8 +4,16 @@ Contains domain models, enums, strategies, and domain services.
 No dependencies on infrastructure or external frameworks.
 """
 
-from samples.okx_market_maker.domain.enums import OrderState
+from samples.okx_market_maker.domain.enums import (
+    TERMINAL_ORDER_STATES,
+    TERMINAL_STATE_MASK,
+    OrderState,
+    Side,
+)
 
 __all__ = [
     "OrderState",
+    "Side",
+    "TERMINAL_ORDER_STATES",
+    "TERMINAL_STATE_MASK",
 ]
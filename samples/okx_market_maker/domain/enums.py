@@ -5,12 +5,16 @@ Contains enums used across the domain layer.
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import IntEnum, StrEnum
 
 
-class OrderState(Enum):
+class OrderState(IntEnum):
     """Order lifecycle states.
 
+    Members are small ints, so comparisons and hashing run at C level.
+    Each member also carries its lowercase name as `label` (used for
+    serialization) and a distinct bit as `flag` (for mask-based checks).
+
     State transitions:
         PENDING -> SENT (on send)
         SENT -> ACK (on order accepted)
@@ -26,12 +30,50 @@ class OrderState(Enum):
         AMENDING -> REJECTED (on amend rejected)
     """
 
-    PENDING = "pending"           # Created but not sent
-    SENT = "sent"                 # Sent to exchange
-    ACK = "ack"                   # Acknowledged by exchange
-    LIVE = "live"                 # Active on exchange
-    PARTIALLY_FILLED = "partial"  # Partially filled
-    FILLED = "filled"             # Completely filled
-    CANCELED = "canceled"         # Canceled
-    REJECTED = "rejected"         # Rejected by exchange
-    AMENDING = "amending"         # Amendment in progress
+    label: str
+    flag: int
+
+    def __new__(cls, value: int, label: str) -> OrderState:
+        """Create a member with its serialized label and bit flag."""
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.label = label
+        member.flag = 1 << value
+        return member
+
+    PENDING = 0, "pending"            # Created but not sent
+    SENT = 1, "sent"                  # Sent to exchange
+    ACK = 2, "ack"                    # Acknowledged by exchange
+    LIVE = 3, "live"                  # Active on exchange
+    PARTIALLY_FILLED = 4, "partial"   # Partially filled
+    FILLED = 5, "filled"              # Completely filled
+    CANCELED = 6, "canceled"          # Canceled
+    REJECTED = 7, "rejected"          # Rejected by exchange
+    AMENDING = 8, "amending"          # Amendment in progress
+
+
+class Side(StrEnum):
+    """Order side.
+
+    Members are str instances, so they compare equal to the plain "buy"/"sell"
+    strings used by the exchange and format as those values in logs. Orders
+    normalize their side to a member, which keeps hot-path comparisons to an
+    identity check.
+    """
+
+    BUY = "buy"
+    SELL = "sell"
+
+
+# States from which an order can no longer change
+TERMINAL_ORDER_STATES: frozenset[OrderState] = frozenset({
+    OrderState.FILLED,
+    OrderState.CANCELED,
+    OrderState.REJECTED,
+})
+
+# Bitmask of TERMINAL_ORDER_STATES: `state.flag & TERMINAL_STATE_MASK`
+# avoids the Python-level Enum.__hash__ call of a set lookup
+TERMINAL_STATE_MASK: int = (
+    OrderState.FILLED.flag | OrderState.CANCELED.flag | OrderState.REJECTED.flag
+)
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AmendRequest:
     """Request to amend an existing order.
 
@@ -9,30 +9,34 @@ from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from samples.okx_market_maker.domain.enums import Side
+
 if TYPE_CHECKING:
     from samples.okx_market_maker.domain.models.amend_request import AmendRequest
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Quote:
     """A single quote (bid or ask) to place.
 
     Attributes:
         price: Quote price
         size: Quote size
-        side: "buy" or "sell"
+        side: Side.BUY or Side.SELL
     """
 
     price: Decimal
     size: Decimal
-    side: str  # "buy" or "sell"
+    side: Side
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StrategyDecision:
     """Decision output from strategy.
 
-    Contains the orders to place, amend, and cancel.
+    Contains the orders to place, amend, and cancel. The order collections
+    are tuples, so the buy/sell counts and has_actions taken at construction
+    always match them.
 
     Attributes:
         orders_to_place: New orders to place
@@ -42,27 +46,36 @@ class StrategyDecision:
         halt_reason: Reason for halting if should_halt is True
     """
 
-    orders_to_place: list[Quote] = field(default_factory=list)
-    orders_to_amend: list[AmendRequest] = field(default_factory=list)
-    orders_to_cancel: list[str] = field(default_factory=list)
+    orders_to_place: tuple[Quote, ...] = ()
+    orders_to_amend: tuple[AmendRequest, ...] = ()
+    orders_to_cancel: tuple[str, ...] = ()
     should_halt: bool = False
     halt_reason: str | None = None
+    _num_buys: int = field(init=False, repr=False, compare=False)
+    _has_actions: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute counts; every quote is either a buy or a sell."""
+        buy = Side.BUY
+        num_buys = sum(1 for q in self.orders_to_place if q.side == buy)
+        object.__setattr__(self, "_num_buys", num_buys)
+        object.__setattr__(
+            self,
+            "_has_actions",
+            bool(self.orders_to_place or self.orders_to_amend or self.orders_to_cancel),
+        )
 
     @property
     def has_actions(self) -> bool:
         """Check if decision has any actions to take."""
-        return bool(
-            self.orders_to_place
-            or self.orders_to_amend
-            or self.orders_to_cancel
-        )
+        return self._has_actions
 
     @property
     def num_buys_to_place(self) -> int:
         """Count buy orders to place."""
-        return sum(1 for q in self.orders_to_place if q.side == "buy")
+        return self._num_buys
 
     @property
     def num_sells_to_place(self) -> int:
         """Count sell orders to place."""
-        return sum(1 for q in self.orders_to_place if q.side == "sell")
+        return len(self.orders_to_place) - self._num_buys
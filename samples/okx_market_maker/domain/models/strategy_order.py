@@ -5,15 +5,53 @@ Tracks order lifecycle from creation through fill/cancel.
 
 from __future__ import annotations
 
+import time
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from decimal import Decimal
-from typing import Literal
+from typing import Any
 
-from samples.okx_market_maker.domain.enums import OrderState
+from samples.okx_market_maker.domain.enums import TERMINAL_STATE_MASK, OrderState, Side
 
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
 
-@dataclass
+# State masks for multi-state checks (see OrderState.flag)
+_LIVE_MASK = OrderState.LIVE.flag | OrderState.PARTIALLY_FILLED.flag
+_AMENDABLE_MASK = _LIVE_MASK
+_CANCELABLE_MASK = _LIVE_MASK | OrderState.AMENDING.flag
+_LIVE_FROM_MASK = OrderState.ACK.flag | OrderState.AMENDING.flag
+
+# Exchange order state strings mapped to OrderState. A single dict.get is
+# kept over a `match` on string literals, which CPython compiles to a chain
+# of equality checks rather than a jump table.
+_EXCHANGE_STATE_MAP: dict[str, OrderState] = {
+    "live": OrderState.LIVE,
+    "partially_filled": OrderState.PARTIALLY_FILLED,
+    "filled": OrderState.FILLED,
+    "canceled": OrderState.CANCELED,
+    "mmp_canceled": OrderState.CANCELED,
+}
+
+
+def _transition_error(action: str, state: OrderState) -> ValueError:
+    """Build the error for a disallowed state transition.
+
+    Only called once a guard has failed, so the successful path is just
+    the state check.
+
+    Args:
+        action: Transition being attempted (e.g. "cancel")
+        state: Current order state
+
+    Returns:
+        ValueError describing the transition
+    """
+    return ValueError(f"Cannot {action} from state {state.label}")
+
+
+@dataclass(slots=True)
 class StrategyOrder:
     """Strategy order tracking with state machine.
 
@@ -23,15 +61,15 @@ class StrategyOrder:
     Attributes:
         cl_ord_id: Client-assigned order ID (unique)
         inst_id: Instrument ID
-        side: Order side ("buy" or "sell")
+        side: Order side (Side.BUY or Side.SELL; plain strings are normalized)
         price: Order price
         size: Order size
         state: Current order state
         ord_id: Exchange-assigned order ID (after ACK)
         filled_size: Accumulated fill size
         avg_fill_price: Average fill price
-        created_at: Order creation timestamp
-        updated_at: Last update timestamp
+        created_at: Order creation time (epoch nanoseconds)
+        updated_at: Last update time (epoch nanoseconds)
         amend_price: Pending amendment price
         amend_size: Pending amendment size
 
@@ -56,44 +94,44 @@ class StrategyOrder:
 
     cl_ord_id: str
     inst_id: str
-    side: Literal["buy", "sell"]
+    side: Side
     price: Decimal
     size: Decimal
     state: OrderState = OrderState.PENDING
     ord_id: str | None = None
-    filled_size: Decimal = Decimal("0")
+    filled_size: Decimal = _ZERO
     avg_fill_price: Decimal | None = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: int = field(default_factory=time.time_ns)
+    updated_at: int = field(default_factory=time.time_ns)
     amend_price: Decimal | None = None
     amend_size: Decimal | None = None
     error_message: str | None = None
 
+    def __post_init__(self) -> None:
+        """Normalize side to a Side member."""
+        self.side = Side(self.side)
+
     # --- State Properties ---
 
     @property
     def is_pending(self) -> bool:
         """Check if order is pending (not yet sent)."""
-        return self.state == OrderState.PENDING
+        return self.state is OrderState.PENDING
 
     @property
     def is_sent(self) -> bool:
         """Check if order has been sent."""
-        return self.state == OrderState.SENT
+        return self.state is OrderState.SENT
 
     @property
     def is_live(self) -> bool:
         """Check if order is live on exchange."""
-        return self.state in (OrderState.LIVE, OrderState.PARTIALLY_FILLED)
+        return bool(self.state.flag & _LIVE_MASK)
 
     @property
     def is_active(self) -> bool:
         """Check if order is still active (not terminal)."""
-        return self.state not in (
-            OrderState.FILLED,
-            OrderState.CANCELED,
-            OrderState.REJECTED,
-        )
+        return not self.state.flag & TERMINAL_STATE_MASK
 
     @property
     def is_terminal(self) -> bool:
@@ -103,81 +141,96 @@ class StrategyOrder:
     @property
     def is_filled(self) -> bool:
         """Check if order is completely filled."""
-        return self.state == OrderState.FILLED
+        return self.state is OrderState.FILLED
 
     @property
     def is_partially_filled(self) -> bool:
         """Check if order is partially filled."""
-        return self.state == OrderState.PARTIALLY_FILLED
+        return self.state is OrderState.PARTIALLY_FILLED
 
     @property
     def is_canceled(self) -> bool:
         """Check if order was canceled."""
-        return self.state == OrderState.CANCELED
+        return self.state is OrderState.CANCELED
 
     @property
     def is_rejected(self) -> bool:
         """Check if order was rejected."""
-        return self.state == OrderState.REJECTED
+        return self.state is OrderState.REJECTED
 
     @property
     def is_amending(self) -> bool:
         """Check if order has pending amendment."""
-        return self.state == OrderState.AMENDING
+        return self.state is OrderState.AMENDING
 
     @property
     def is_buy(self) -> bool:
         """Check if this is a buy order."""
-        return self.side == "buy"
+        return self.side is Side.BUY
 
     @property
     def is_sell(self) -> bool:
         """Check if this is a sell order."""
-        return self.side == "sell"
+        return self.side is Side.SELL
 
     # --- Calculated Properties ---
 
     @property
-    def remaining_size(self) -> Decimal:
-        """Calculate remaining unfilled size."""
-        return self.size - self.filled_size
-
-    @property
-    def fill_ratio(self) -> Decimal:
-        """Calculate fill ratio (0-1)."""
-        if self.size == 0:
-            return Decimal("0")
-        return self.filled_size / self.size
+    def created_at_dt(self) -> datetime:
+        """Get creation time as a UTC datetime."""
+        return datetime.fromtimestamp(self.created_at / 1e9, UTC)
 
     @property
-    def fill_percent(self) -> Decimal:
-        """Calculate fill percentage (0-100)."""
-        return self.fill_ratio * 100
+    def updated_at_dt(self) -> datetime:
+        """Get last update time as a UTC datetime."""
+        return datetime.fromtimestamp(self.updated_at / 1e9, UTC)
 
     @property
     def effective_price(self) -> Decimal:
         """Get effective price (amended price if amending, else current)."""
-        if self.amend_price is not None and self.is_amending:
+        if self.amend_price is not None and self.state is OrderState.AMENDING:
             return self.amend_price
         return self.price
 
     @property
     def effective_size(self) -> Decimal:
         """Get effective size (amended size if amending, else current)."""
-        if self.amend_size is not None and self.is_amending:
+        if self.amend_size is not None and self.state is OrderState.AMENDING:
             return self.amend_size
         return self.size
 
+    @property
+    def remaining_size(self) -> Decimal:
+        """Calculate remaining unfilled size."""
+        return self.size - self.filled_size
+
+    @property
+    def fill_ratio(self) -> Decimal:
+        """Calculate fill ratio (0-1)."""
+        if self.size == 0:
+            return _ZERO
+        return self.filled_size / self.size
+
+    @property
+    def fill_percent(self) -> Decimal:
+        """Calculate fill percentage (0-100)."""
+        return self.fill_ratio * _HUNDRED
+
     # --- State Transitions ---
 
-    def _touch(self) -> None:
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.now(UTC)
+    def _touch(self, now_ns: int | None = None) -> None:
+        """Update the updated_at timestamp.
+
+        Args:
+            now_ns: Shared epoch-nanosecond timestamp for a batch of updates
+                (read from the clock if None)
+        """
+        self.updated_at = time.time_ns() if now_ns is None else now_ns
 
     def mark_sent(self) -> None:
         """Mark order as sent to exchange."""
-        if self.state != OrderState.PENDING:
-            raise ValueError(f"Cannot mark as sent from state {self.state}")
+        if self.state is not OrderState.PENDING:
+            raise _transition_error("mark as sent", self.state)
         self.state = OrderState.SENT
         self._touch()
 
@@ -187,16 +240,16 @@ class StrategyOrder:
         Args:
             ord_id: Exchange-assigned order ID
         """
-        if self.state != OrderState.SENT:
-            raise ValueError(f"Cannot mark as ack from state {self.state}")
+        if self.state is not OrderState.SENT:
+            raise _transition_error("mark as ack", self.state)
         self.ord_id = ord_id
         self.state = OrderState.ACK
         self._touch()
 
     def mark_live(self) -> None:
         """Mark order as live on exchange."""
-        if self.state not in (OrderState.ACK, OrderState.AMENDING):
-            raise ValueError(f"Cannot mark as live from state {self.state}")
+        if not self.state.flag & _LIVE_FROM_MASK:
+            raise _transition_error("mark as live", self.state)
         self.state = OrderState.LIVE
         self.amend_price = None
         self.amend_size = None
@@ -214,8 +267,8 @@ class StrategyOrder:
 
     def mark_canceled(self) -> None:
         """Mark order as canceled."""
-        if self.state not in (OrderState.LIVE, OrderState.PARTIALLY_FILLED, OrderState.AMENDING):
-            raise ValueError(f"Cannot cancel from state {self.state}")
+        if not self.state.flag & _CANCELABLE_MASK:
+            raise _transition_error("cancel", self.state)
         self.state = OrderState.CANCELED
         self._touch()
 
@@ -226,14 +279,19 @@ class StrategyOrder:
             new_price: New price (optional)
             new_size: New size (optional)
         """
-        if self.state not in (OrderState.LIVE, OrderState.PARTIALLY_FILLED):
-            raise ValueError(f"Cannot amend from state {self.state}")
+        if not self.state.flag & _AMENDABLE_MASK:
+            raise _transition_error("amend", self.state)
         self.state = OrderState.AMENDING
         self.amend_price = new_price
         self.amend_size = new_size
         self._touch()
 
-    def record_fill(self, fill_size: Decimal, fill_price: Decimal) -> None:
+    def record_fill(
+        self,
+        fill_size: Decimal,
+        fill_price: Decimal,
+        now_ns: int | None = None,
+    ) -> None:
         """Record a fill for this order.
 
         Updates filled_size, avg_fill_price, and state.
@@ -241,15 +299,16 @@ class StrategyOrder:
         Args:
             fill_size: Size of this fill
             fill_price: Price of this fill
+            now_ns: Shared epoch-nanosecond timestamp for a batch of updates
         """
-        if not self.is_active:
-            raise ValueError(f"Cannot fill order in state {self.state}")
+        if self.state.flag & TERMINAL_STATE_MASK:
+            raise ValueError(f"Cannot fill order in state {self.state.label}")
 
         # Update average fill price
         if self.filled_size == 0:
             self.avg_fill_price = fill_price
         else:
-            total_value = (self.avg_fill_price or Decimal("0")) * self.filled_size
+            total_value = (self.avg_fill_price or _ZERO) * self.filled_size
             total_value += fill_price * fill_size
             self.avg_fill_price = total_value / (self.filled_size + fill_size)
 
@@ -261,7 +320,7 @@ class StrategyOrder:
         else:
             self.state = OrderState.PARTIALLY_FILLED
 
-        self._touch()
+        self._touch(now_ns)
 
     def confirm_amend(self, new_price: Decimal | None = None, new_size: Decimal | None = None) -> None:
         """Confirm amendment was applied.
@@ -270,8 +329,8 @@ class StrategyOrder:
             new_price: Confirmed new price
             new_size: Confirmed new size
         """
-        if self.state != OrderState.AMENDING:
-            raise ValueError(f"Cannot confirm amend from state {self.state}")
+        if self.state is not OrderState.AMENDING:
+            raise _transition_error("confirm amend", self.state)
 
         if new_price is not None:
             self.price = new_price
@@ -296,25 +355,21 @@ class StrategyOrder:
         filled_size: Decimal | None = None,
         avg_price: Decimal | None = None,
         ord_id: str | None = None,
+        now_ns: int | None = None,
     ) -> None:
         """Update order from exchange data.
 
-        Maps exchange state strings to OrderState.
+        Maps exchange state strings to OrderState. A non-terminal state
+        never reopens a terminal order: a push sent before a cancel was
+        confirmed still updates the fill fields but leaves it canceled.
 
         Args:
             state: Exchange state string (live, filled, canceled, etc.)
             filled_size: Current filled size
             avg_price: Average fill price
             ord_id: Exchange order ID
+            now_ns: Shared epoch-nanosecond timestamp for a batch of updates
         """
-        state_map = {
-            "live": OrderState.LIVE,
-            "partially_filled": OrderState.PARTIALLY_FILLED,
-            "filled": OrderState.FILLED,
-            "canceled": OrderState.CANCELED,
-            "mmp_canceled": OrderState.CANCELED,
-        }
-
         if ord_id:
             self.ord_id = ord_id
 
@@ -324,10 +379,13 @@ class StrategyOrder:
         if avg_price is not None:
             self.avg_fill_price = avg_price
 
-        if state in state_map:
-            self.state = state_map[state]
+        new_state = _EXCHANGE_STATE_MAP.get(state)
+        if new_state is not None and (
+            new_state.flag & TERMINAL_STATE_MASK or not self.state.flag & TERMINAL_STATE_MASK
+        ):
+            self.state = new_state
 
-        self._touch()
+        self._touch(now_ns)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for logging/debugging.
@@ -342,8 +400,64 @@ class StrategyOrder:
             "side": self.side,
             "price": str(self.price),
             "size": str(self.size),
-            "state": self.state.value,
+            "state": self.state.label,
             "filled_size": str(self.filled_size),
             "avg_fill_price": str(self.avg_fill_price) if self.avg_fill_price else None,
             "remaining_size": str(self.remaining_size),
+            "created_at": self.created_at_dt.isoformat(),
+            "updated_at": self.updated_at_dt.isoformat(),
         }
+
+    def to_dict_lazy(self) -> Mapping[str, Any]:
+        """Get a read-only view with the same keys and values as to_dict.
+
+        Values are formatted only when accessed, so passing the view to a
+        log call that gets filtered out costs no string conversions.
+
+        Returns:
+            Mapping view of the order
+        """
+        return _LazyOrderDict(self)
+
+
+# Formatters for each to_dict key, used by the lazy view
+_DICT_FIELDS: dict[str, Callable[[StrategyOrder], Any]] = {
+    "cl_ord_id": lambda o: o.cl_ord_id,
+    "ord_id": lambda o: o.ord_id,
+    "inst_id": lambda o: o.inst_id,
+    "side": lambda o: o.side,
+    "price": lambda o: str(o.price),
+    "size": lambda o: str(o.size),
+    "state": lambda o: o.state.label,
+    "filled_size": lambda o: str(o.filled_size),
+    "avg_fill_price": lambda o: str(o.avg_fill_price) if o.avg_fill_price else None,
+    "remaining_size": lambda o: str(o.remaining_size),
+    "created_at": lambda o: o.created_at_dt.isoformat(),
+    "updated_at": lambda o: o.updated_at_dt.isoformat(),
+}
+
+
+class _LazyOrderDict(Mapping[str, Any]):
+    """Mapping over a StrategyOrder that formats values on access."""
+
+    __slots__ = ("_order",)
+
+    def __init__(self, order: StrategyOrder) -> None:
+        """Initialize view.
+
+        Args:
+            order: Order to expose
+        """
+        self._order = order
+
+    def __getitem__(self, key: str) -> Any:
+        """Format and return the value for key."""
+        return _DICT_FIELDS[key](self._order)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over to_dict keys."""
+        return iter(_DICT_FIELDS)
+
+    def __len__(self) -> int:
+        """Get number of keys."""
+        return len(_DICT_FIELDS)
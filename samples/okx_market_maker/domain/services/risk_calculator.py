@@ -9,10 +9,15 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from samples.okx_market_maker.domain.enums import Side
+
 if TYPE_CHECKING:
     from samples.okx_market_maker.application.context.market_context import MarketContext
     from samples.okx_market_maker.core.config.settings import MarketMakerSettings
 
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+
 
 @dataclass(frozen=True)
 class RiskMetrics:
@@ -63,7 +68,13 @@ class RiskCalculator:
             settings: Market maker configuration
         """
         self.settings = settings
-        self._realized_pnl = Decimal("0")
+        self._realized_pnl = _ZERO
+
+        # Limits read on every calculate()
+        self._max_net_buy = settings.max_net_buy
+        self._min_net_pos = -settings.max_net_sell
+        self._max_pos = max(settings.max_net_buy, settings.max_net_sell)
+        self._max_position_value_usd = settings.max_position_value_usd
 
     def calculate(self, context: MarketContext) -> RiskMetrics:
         """Calculate current risk metrics.
@@ -75,31 +86,26 @@ class RiskCalculator:
             RiskMetrics with current risk state
         """
         net_pos = context.net_position
-        mid_price = context.mid_price or Decimal("0")
+        mid_price = context.mid_price or _ZERO
 
         # Calculate position value
-        position_value_usd = abs(net_pos) * mid_price
+        abs_pos = abs(net_pos)
+        position_value_usd = abs_pos * mid_price
 
         # Calculate unrealized P&L
         # This is simplified - real implementation would use entry prices
         unrealized_pnl = self._calculate_unrealized_pnl(context)
 
-        # Calculate order exposure
-        buy_exposure = sum(
-            order.size * order.price
-            for order in context.active_buy_orders
-        )
-        sell_exposure = sum(
-            order.size * order.price
-            for order in context.active_sell_orders
-        )
+        # Order exposure is maintained incrementally by the context
+        buy_exposure = context.buy_exposure
+        sell_exposure = context.sell_exposure
 
         # Calculate position limit usage
-        max_pos = max(self.settings.max_net_buy, self.settings.max_net_sell)
+        max_pos = self._max_pos
         if max_pos > 0:
-            max_position_used_pct = abs(net_pos) / max_pos * 100
+            max_position_used_pct = abs_pos / max_pos * _HUNDRED
         else:
-            max_position_used_pct = Decimal("0")
+            max_position_used_pct = _ZERO
 
         # Check if within limits
         is_within_limits = self._check_limits(
@@ -134,7 +140,7 @@ class RiskCalculator:
         """
         pos = context.position_for_inst
         if pos is None or pos.pos == 0:
-            return Decimal("0")
+            return _ZERO
 
         return pos.upl
 
@@ -156,21 +162,15 @@ class RiskCalculator:
         Returns:
             True if within all limits
         """
-        # Check position limits
-        if net_pos > self.settings.max_net_buy:
-            return False
-        if net_pos < -self.settings.max_net_sell:
-            return False
-
-        # Check position value limit
-        if position_value_usd > self.settings.max_position_value_usd:
-            return False
-
-        return True
+        # Position limits, then position value limit
+        return (
+            self._min_net_pos <= net_pos <= self._max_net_buy
+            and position_value_usd <= self._max_position_value_usd
+        )
 
     def record_fill(
         self,
-        side: str,
+        side: Side | str,
         size: Decimal,
         price: Decimal,
         avg_position_price: Decimal | None,
@@ -178,7 +178,7 @@ class RiskCalculator:
         """Record a fill and calculate realized P&L.
 
         Args:
-            side: "buy" or "sell"
+            side: Side.BUY or Side.SELL
             size: Fill size
             price: Fill price
             avg_position_price: Average position price before fill
@@ -189,9 +189,9 @@ class RiskCalculator:
         # This is a simplified P&L calculation
         # Real implementation would track entry prices properly
         if avg_position_price is None:
-            return Decimal("0")
+            return _ZERO
 
-        if side == "sell":
+        if side == Side.SELL:
             # Selling - realize profit/loss vs avg position price
             pnl = (price - avg_position_price) * size
         else:
@@ -208,4 +208,4 @@ class RiskCalculator:
 
     def reset_pnl(self) -> None:
         """Reset realized P&L tracking."""
-        self._realized_pnl = Decimal("0")
+        self._realized_pnl = _ZERO
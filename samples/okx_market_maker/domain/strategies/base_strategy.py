@@ -8,17 +8,30 @@ Abstract base class that provides:
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from decimal import Decimal
+from decimal import ROUND_HALF_EVEN, Decimal
+from operator import attrgetter, eq
 from typing import TYPE_CHECKING
 
+from samples.okx_market_maker.core.utils.instrument_util import (
+    round_price_to_tick,
+    round_size_to_lot,
+)
+from samples.okx_market_maker.domain.enums import Side
 from samples.okx_market_maker.domain.models.quote import Quote, StrategyDecision
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from samples.okx_market_maker.application.context.market_context import MarketContext
     from samples.okx_market_maker.core.config.settings import MarketMakerSettings
+    from samples.okx_market_maker.core.utils.instrument_util import Quantizer
     from samples.okx_market_maker.domain.models.strategy_order import StrategyOrder
 
+# Sort key for orders and quotes when matching them by price
+_BY_PRICE = attrgetter("price")
+
 
 class BaseStrategy(ABC):
     """Abstract base class for market making strategies.
@@ -36,8 +49,8 @@ class BaseStrategy(ABC):
                 # Generate quotes based on market state
                 mid = context.mid_price
                 return [
-                    Quote(mid * Decimal("0.999"), Decimal("0.001"), "buy"),
-                    Quote(mid * Decimal("1.001"), Decimal("0.001"), "sell"),
+                    Quote(mid * Decimal("0.999"), Decimal("0.001"), Side.BUY),
+                    Quote(mid * Decimal("1.001"), Decimal("0.001"), Side.SELL),
                 ]
     """
 
@@ -64,6 +77,21 @@ class BaseStrategy(ABC):
         """
         ...
 
+    def compute_quotes_batch(self, contexts: Sequence[MarketContext]) -> list[list[Quote]]:
+        """Compute quotes for several instruments in one call.
+
+        The default loops over compute_quotes; subclasses may override to
+        share work across instruments.
+
+        Args:
+            contexts: Market contexts, one per instrument
+
+        Returns:
+            Quotes for each context, in the same order
+        """
+        compute_quotes = self.compute_quotes
+        return [compute_quotes(context) for context in contexts]
+
     def decide(self, context: MarketContext) -> StrategyDecision:
         """Compute strategy decision based on current market state.
 
@@ -82,11 +110,11 @@ class BaseStrategy(ABC):
         should_halt, halt_reason = self.should_halt(context)
         if should_halt:
             # Cancel all orders when halting
-            orders_to_cancel = [
+            orders_to_cancel = tuple(
                 order.cl_ord_id
                 for order in context.live_orders.values()
                 if order.is_active
-            ]
+            )
             return StrategyDecision(
                 orders_to_cancel=orders_to_cancel,
                 should_halt=True,
@@ -111,7 +139,8 @@ class BaseStrategy(ABC):
         - Cancel (existing order doesn't match any quote)
         - Place (new quote doesn't match any order)
 
-        Uses price tolerance for matching (within tick size).
+        Uses price tolerance for matching (within tick size), matching each
+        side with a sorted merge rather than comparing every pair.
 
         Args:
             context: Current market context
@@ -125,55 +154,81 @@ class BaseStrategy(ABC):
         orders_to_cancel: list[str] = []
 
         # Get active orders by side
-        active_buys = list(context.active_buy_orders)
-        active_sells = list(context.active_sell_orders)
-
-        # Split desired quotes by side
-        desired_buys = [q for q in desired_quotes if q.side == "buy"]
-        desired_sells = [q for q in desired_quotes if q.side == "sell"]
-
-        # Match buys
-        matched_buy_orders: set[str] = set()
-        for quote in desired_buys:
-            matched = False
-            for order in active_buys:
-                if order.cl_ord_id in matched_buy_orders:
-                    continue
-                # Match if price is within tick
-                if abs(order.price - quote.price) <= tick_size:
-                    matched_buy_orders.add(order.cl_ord_id)
-                    matched = True
-                    break
-            if not matched:
-                orders_to_place.append(quote)
-
-        # Cancel unmatched buy orders
-        for order in active_buys:
-            if order.cl_ord_id not in matched_buy_orders:
-                orders_to_cancel.append(order.cl_ord_id)
-
-        # Match sells
-        matched_sell_orders: set[str] = set()
-        for quote in desired_sells:
-            matched = False
-            for order in active_sells:
-                if order.cl_ord_id in matched_sell_orders:
-                    continue
-                if abs(order.price - quote.price) <= tick_size:
-                    matched_sell_orders.add(order.cl_ord_id)
-                    matched = True
-                    break
-            if not matched:
-                orders_to_place.append(quote)
-
-        # Cancel unmatched sell orders
-        for order in active_sells:
-            if order.cl_ord_id not in matched_sell_orders:
-                orders_to_cancel.append(order.cl_ord_id)
+        active_buys, active_sells = context.partition_active_orders()
+
+        # Split desired quotes by side in one pass (member lookup hoisted,
+        # since enum attribute access is not free)
+        desired_buys: list[Quote] = []
+        desired_sells: list[Quote] = []
+        buy = Side.BUY
+        for quote in desired_quotes:
+            (desired_buys if quote.side == buy else desired_sells).append(quote)
+
+        self._match_side(active_buys, desired_buys, tick_size, orders_to_place, orders_to_cancel)
+        self._match_side(active_sells, desired_sells, tick_size, orders_to_place, orders_to_cancel)
 
         return StrategyDecision(
-            orders_to_place=orders_to_place,
-            orders_to_cancel=orders_to_cancel,
+            orders_to_place=tuple(orders_to_place),
+            orders_to_cancel=tuple(orders_to_cancel),
+        )
+
+    @staticmethod
+    def _match_side(
+        orders: list[StrategyOrder],
+        quotes: list[Quote],
+        tick_size: Decimal,
+        orders_to_place: list[Quote],
+        orders_to_cancel: list[str],
+    ) -> None:
+        """Match one side's desired quotes against its active orders.
+
+        Walks orders and quotes in price order, pairing an order and a quote
+        when their prices are within one tick, so each entry is compared
+        only with its neighbours on the other side.
+
+        Args:
+            orders: Active orders on this side
+            quotes: Desired quotes on this side
+            tick_size: Price tolerance for a match
+            orders_to_place: Receives unmatched quotes, in quote order
+            orders_to_cancel: Receives unmatched order IDs, in order order
+        """
+        if not orders or not quotes:
+            orders_to_place.extend(quotes)
+            orders_to_cancel.extend(order.cl_ord_id for order in orders)
+            return
+
+        # Steady state: the book already holds exactly these prices
+        if len(orders) == len(quotes) and all(
+            map(eq, map(_BY_PRICE, orders), map(_BY_PRICE, quotes))
+        ):
+            return
+
+        sorted_orders = sorted(orders, key=_BY_PRICE)
+        sorted_quotes = sorted(quotes, key=_BY_PRICE)
+        matched_orders: set[str] = set()
+        matched_quotes: set[int] = set()
+
+        i = j = 0
+        while i < len(sorted_orders) and j < len(sorted_quotes):
+            order = sorted_orders[i]
+            quote = sorted_quotes[j]
+            diff = order.price - quote.price
+            if abs(diff) <= tick_size:
+                matched_orders.add(order.cl_ord_id)
+                matched_quotes.add(id(quote))
+                i += 1
+                j += 1
+            elif diff < 0:
+                # Order is below every remaining quote's tolerance
+                i += 1
+            else:
+                # Quote is below every remaining order's tolerance
+                j += 1
+
+        orders_to_place.extend(q for q in quotes if id(q) not in matched_quotes)
+        orders_to_cancel.extend(
+            order.cl_ord_id for order in orders if order.cl_ord_id not in matched_orders
         )
 
     def should_halt(self, context: MarketContext) -> tuple[bool, str | None]:
@@ -190,13 +245,14 @@ class BaseStrategy(ABC):
             Tuple of (should_halt, reason)
         """
         # Check data freshness
-        if not context.is_orderbook_fresh(self.settings.orderbook_max_delay_sec):
+        now = time.monotonic()
+        if not context.is_orderbook_fresh(self.settings.orderbook_max_delay_sec, now):
             return True, "Orderbook data is stale"
 
-        if not context.is_account_fresh(self.settings.account_max_delay_sec):
+        if not context.is_account_fresh(self.settings.account_max_delay_sec, now):
             return True, "Account data is stale"
 
-        if not context.is_position_fresh(self.settings.position_max_delay_sec):
+        if not context.is_position_fresh(self.settings.position_max_delay_sec, now):
             return True, "Position data is stale"
 
         # Check position limits
@@ -254,7 +310,7 @@ class BaseStrategy(ABC):
         Returns:
             Price rounded to nearest tick
         """
-        return (price / tick_size).quantize(Decimal("1")) * tick_size
+        return round_price_to_tick(price, tick_size, ROUND_HALF_EVEN)
 
     def round_size(self, size: Decimal, lot_size: Decimal) -> Decimal:
         """Round size to nearest lot.
@@ -266,4 +322,42 @@ class BaseStrategy(ABC):
         Returns:
             Size rounded to nearest lot
         """
-        return (size / lot_size).quantize(Decimal("1")) * lot_size
+        return round_size_to_lot(size, lot_size, ROUND_HALF_EVEN)
+
+    @staticmethod
+    def ladder_quotes(
+        center: float,
+        step: float,
+        buy_orders: int,
+        sell_orders: int,
+        size: Decimal,
+        quantizer: Quantizer,
+    ) -> list[Quote]:
+        """Build buy and sell ladders around a center price.
+
+        Level i sits step * i below (buy) or above (sell) center. Prices are
+        rounded to whole ticks as floats and become Decimal only at the
+        quote; buy levels at or below zero are skipped.
+
+        Args:
+            center: Center price of the ladder
+            step: Price distance between levels
+            buy_orders: Number of buy levels
+            sell_orders: Number of sell levels
+            size: Size of every quote (already rounded to lots)
+            quantizer: Tick/lot quantizer for the instrument
+
+        Returns:
+            Buy quotes, nearest first, followed by sell quotes, nearest first
+        """
+        quotes: list[Quote] = []
+        for i in range(1, buy_orders + 1):
+            ticks = quantizer.float_to_ticks(center - step * i)
+            if ticks > 0:
+                quotes.append(
+                    Quote(price=quantizer.ticks_to_price(ticks), size=size, side=Side.BUY)
+                )
+        for i in range(1, sell_orders + 1):
+            ticks = quantizer.float_to_ticks(center + step * i)
+            quotes.append(Quote(price=quantizer.ticks_to_price(ticks), size=size, side=Side.SELL))
+        return quotes
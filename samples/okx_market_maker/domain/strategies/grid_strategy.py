@@ -6,9 +6,10 @@ Orders are placed at fixed percentage steps from the best bid/ask.
 
 from __future__ import annotations
 
-from decimal import Decimal
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from samples.okx_market_maker.domain.enums import Side
 from samples.okx_market_maker.domain.models.quote import Quote
 from samples.okx_market_maker.domain.strategies.base_strategy import BaseStrategy
 
@@ -16,6 +17,28 @@ if TYPE_CHECKING:
     from samples.okx_market_maker.application.context.market_context import MarketContext
 
 
+@lru_cache(maxsize=16)
+def _ladder_multipliers(
+    step_pct: float,
+    levels: int,
+) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Build the per-level price multipliers for a grid.
+
+    Keyed by the settings values, so a settings change simply selects a
+    different cached ladder.
+
+    Args:
+        step_pct: Price step between levels
+        levels: Number of levels per side
+
+    Returns:
+        Tuple of (buy multipliers, sell multipliers), nearest level first
+    """
+    buys = tuple(1 - step_pct * i for i in range(1, levels + 1))
+    sells = tuple(1 + step_pct * i for i in range(1, levels + 1))
+    return buys, sells
+
+
 class GridStrategy(BaseStrategy):
     """Symmetric grid market making strategy.
 
@@ -58,7 +81,6 @@ class GridStrategy(BaseStrategy):
             return []
 
         quotes: list[Quote] = []
-        tick_size = context.tick_size
         lot_size = context.lot_size
 
         # Get settings
@@ -84,23 +106,26 @@ class GridStrategy(BaseStrategy):
             position_ratio = abs(net_pos) / max_sell
             sell_orders = max(1, int(num_orders * (1 - position_ratio)))
 
-        # Generate buy quotes (below best bid)
-        for i in range(1, buy_orders + 1):
-            price = best_bid * (Decimal("1") - step_pct * i)
-            price = self.round_price(price, tick_size)
-            size = self.round_size(order_size, lot_size)
+        # Every level uses the same size, so round and check it once
+        size = self.round_size(order_size, lot_size)
+        if size < context.min_size:
+            return quotes
 
-            if size >= context.min_size:
-                quotes.append(Quote(price=price, size=size, side="buy"))
+        # Ladder prices are computed as integer ticks, Decimal only at the quote
+        quantizer = context.quantizer
+        buy_multipliers, sell_multipliers = _ladder_multipliers(step_pct, num_orders)
+        bid = float(best_bid)
+        ask = float(best_ask)
 
-        # Generate sell quotes (above best ask)
-        for i in range(1, sell_orders + 1):
-            price = best_ask * (Decimal("1") + step_pct * i)
-            price = self.round_price(price, tick_size)
-            size = self.round_size(order_size, lot_size)
+        # Generate buy quotes (below best bid)
+        for multiplier in buy_multipliers[:buy_orders]:
+            ticks = quantizer.float_to_ticks(bid * multiplier)
+            quotes.append(Quote(price=quantizer.ticks_to_price(ticks), size=size, side=Side.BUY))
 
-            if size >= context.min_size:
-                quotes.append(Quote(price=price, size=size, side="sell"))
+        # Generate sell quotes (above best ask)
+        for multiplier in sell_multipliers[:sell_orders]:
+            ticks = quantizer.float_to_ticks(ask * multiplier)
+            quotes.append(Quote(price=quantizer.ticks_to_price(ticks), size=size, side=Side.SELL))
 
         return quotes
 
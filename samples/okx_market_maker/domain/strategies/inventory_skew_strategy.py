@@ -15,6 +15,9 @@ from samples.okx_market_maker.domain.strategies.base_strategy import BaseStrateg
 if TYPE_CHECKING:
     from samples.okx_market_maker.application.context.market_context import MarketContext
 
+# Order-count reduction factor on the side that would grow the position
+_AGGRESSIVE_REDUCTION = Decimal("1.5")
+
 
 class InventorySkewStrategy(BaseStrategy):
     """Inventory-based price skewing strategy.
@@ -56,8 +59,6 @@ class InventorySkewStrategy(BaseStrategy):
         if mid is None:
             return []
 
-        quotes: list[Quote] = []
-        tick_size = context.tick_size
         lot_size = context.lot_size
 
         # Get settings
@@ -73,18 +74,18 @@ class InventorySkewStrategy(BaseStrategy):
 
         if max_pos > 0:
             # Normalize position to [-1, 1]
-            position_ratio = net_pos / max_pos
+            position_ratio = float(net_pos / max_pos)
             # Calculate skew (negative skew shifts prices down)
             skew_pct = skew_factor * position_ratio * max_skew_pct
         else:
-            skew_pct = Decimal("0")
+            skew_pct = 0.0
 
         # Clamp skew to max
         skew_pct = max(-max_skew_pct, min(max_skew_pct, skew_pct))
 
         # Calculate skewed mid price
         # Positive position -> negative skew -> lower mid -> cheaper buys, more attractive sells
-        skewed_mid = mid * (Decimal("1") - skew_pct)
+        skewed_mid = float(mid) * (1 - skew_pct)
 
         # Position-aware order count adjustment
         max_buy = self.settings.max_net_buy
@@ -96,31 +97,21 @@ class InventorySkewStrategy(BaseStrategy):
         if net_pos > 0:
             # Long - reduce buys more aggressively
             position_ratio = net_pos / max_buy
-            buy_orders = max(1, int(num_orders * (1 - position_ratio * Decimal("1.5"))))
+            buy_orders = max(1, int(num_orders * (1 - position_ratio * _AGGRESSIVE_REDUCTION)))
         elif net_pos < 0:
             # Short - reduce sells more aggressively
             position_ratio = abs(net_pos) / max_sell
-            sell_orders = max(1, int(num_orders * (1 - position_ratio * Decimal("1.5"))))
+            sell_orders = max(1, int(num_orders * (1 - position_ratio * _AGGRESSIVE_REDUCTION)))
 
         # Calculate base spread from step
         half_spread = skewed_mid * step_pct
 
-        # Generate buy quotes (below skewed mid)
-        for i in range(1, buy_orders + 1):
-            price = skewed_mid - half_spread * i
-            price = self.round_price(price, tick_size)
-            size = self.round_size(order_size, lot_size)
-
-            if size >= context.min_size and price > 0:
-                quotes.append(Quote(price=price, size=size, side="buy"))
-
-        # Generate sell quotes (above skewed mid)
-        for i in range(1, sell_orders + 1):
-            price = skewed_mid + half_spread * i
-            price = self.round_price(price, tick_size)
-            size = self.round_size(order_size, lot_size)
-
-            if size >= context.min_size:
-                quotes.append(Quote(price=price, size=size, side="sell"))
+        # Every level uses the same size, so round and check it once
+        size = self.round_size(order_size, lot_size)
+        if size < context.min_size:
+            return []
 
-        return quotes
+        # Buys below and sells above the skewed mid
+        return self.ladder_quotes(
+            skewed_mid, half_spread, buy_orders, sell_orders, size, context.quantizer
+        )
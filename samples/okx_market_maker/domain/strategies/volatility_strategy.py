@@ -7,7 +7,6 @@ Adjusts spread based on recent price volatility:
 
 from __future__ import annotations
 
-from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from samples.okx_market_maker.domain.models.quote import Quote
@@ -53,8 +52,6 @@ class VolatilityStrategy(BaseStrategy):
         if mid is None:
             return []
 
-        quotes: list[Quote] = []
-        tick_size = context.tick_size
         lot_size = context.lot_size
 
         # Get settings
@@ -72,7 +69,7 @@ class VolatilityStrategy(BaseStrategy):
 
         if volatility is not None:
             # Spread = volatility * multiplier, clamped to min/max
-            spread_pct = volatility * vol_multiplier
+            spread_pct = float(volatility) * vol_multiplier
             spread_pct = max(min_spread, min(max_spread, spread_pct))
         else:
             # Fall back to minimum spread if not enough data
@@ -83,15 +80,15 @@ class VolatilityStrategy(BaseStrategy):
         max_pos = max(self.settings.max_net_buy, self.settings.max_net_sell)
 
         if max_pos > 0:
-            position_ratio = net_pos / max_pos
+            position_ratio = float(net_pos / max_pos)
             skew_pct = skew_factor * position_ratio * max_skew_pct
         else:
-            skew_pct = Decimal("0")
+            skew_pct = 0.0
 
         skew_pct = max(-max_skew_pct, min(max_skew_pct, skew_pct))
 
         # Calculate skewed mid
-        skewed_mid = mid * (Decimal("1") - skew_pct)
+        skewed_mid = float(mid) * (1 - skew_pct)
 
         # Position-aware order count
         max_buy = self.settings.max_net_buy
@@ -110,26 +107,15 @@ class VolatilityStrategy(BaseStrategy):
         # Calculate half spread for each side
         half_spread = skewed_mid * spread_pct / 2
 
-        # Generate buy quotes
-        for i in range(1, buy_orders + 1):
-            # Each level is half_spread * i below mid
-            price = skewed_mid - half_spread * i
-            price = self.round_price(price, tick_size)
-            size = self.round_size(order_size, lot_size)
-
-            if size >= context.min_size and price > 0:
-                quotes.append(Quote(price=price, size=size, side="buy"))
-
-        # Generate sell quotes
-        for i in range(1, sell_orders + 1):
-            price = skewed_mid + half_spread * i
-            price = self.round_price(price, tick_size)
-            size = self.round_size(order_size, lot_size)
-
-            if size >= context.min_size:
-                quotes.append(Quote(price=price, size=size, side="sell"))
+        # Every level uses the same size, so round and check it once
+        size = self.round_size(order_size, lot_size)
+        if size < context.min_size:
+            return []
 
-        return quotes
+        # Each level is half_spread * i from the skewed mid
+        return self.ladder_quotes(
+            skewed_mid, half_spread, buy_orders, sell_orders, size, context.quantizer
+        )
 
     def should_halt(self, context: MarketContext) -> tuple[bool, str | None]:
         """Extended halt check including volatility circuit breaker.
@@ -150,7 +136,7 @@ class VolatilityStrategy(BaseStrategy):
         if volatility is not None:
             # Halt if volatility exceeds 3x max spread (extreme conditions)
             max_vol = self.settings.max_spread_pct * 3
-            if volatility > max_vol:
+            if float(volatility) > max_vol:
                 return True, f"Extreme volatility: {volatility:.4f} > {max_vol:.4f}"
 
         return False, None
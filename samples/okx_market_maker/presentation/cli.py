@@ -17,9 +17,13 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import logging
 import signal
+import time
+from collections.abc import Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
 
 from client_gw_core import get_logger
 
@@ -54,6 +58,17 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Strategy classes by settings.strategy_type
+_STRATEGY_MAP: Final[Mapping[str, type[BaseStrategy]]] = MappingProxyType({
+    "grid": GridStrategy,
+    "inventory_skew": InventorySkewStrategy,
+    "volatility": VolatilityStrategy,
+})
+
+
+class _ShutdownRequested(Exception):
+    """Raised inside the task group to cancel its tasks on shutdown."""
+
 
 class MarketMaker:
     """Main market maker orchestrator.
@@ -85,7 +100,10 @@ class MarketMaker:
         self.okx_config = OkxConfig(demo=settings.use_demo)
 
         # Create context
-        self.context = MarketContext(inst_id=settings.inst_id)
+        self.context = MarketContext(
+            inst_id=settings.inst_id,
+            requote_move_pct=settings.requote_move_pct,
+        )
 
         # Create strategy
         self.strategy = self._create_strategy(settings)
@@ -102,6 +120,9 @@ class MarketMaker:
         # Control
         self._running = False
         self._shutdown_event = asyncio.Event()
+        self._last_log_mono = float("-inf")
+        self._last_cleanup_mono = time.monotonic()
+        self._idle_decision_key: tuple | None = None
 
     def _create_strategy(self, settings: MarketMakerSettings) -> BaseStrategy:
         """Create strategy based on settings.
@@ -112,13 +133,7 @@ class MarketMaker:
         Returns:
             Strategy instance
         """
-        strategy_map = {
-            "grid": GridStrategy,
-            "inventory_skew": InventorySkewStrategy,
-            "volatility": VolatilityStrategy,
-        }
-
-        strategy_class = strategy_map.get(settings.strategy_type, GridStrategy)
+        strategy_class = _STRATEGY_MAP.get(settings.strategy_type, GridStrategy)
         return strategy_class(settings)
 
     async def run(self) -> None:
@@ -136,7 +151,7 @@ class MarketMaker:
         logger.info(f"Demo mode: {self.settings.use_demo}")
 
         # Setup signal handlers
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, self._handle_shutdown)
 
@@ -147,26 +162,8 @@ class MarketMaker:
             # Load instrument info
             await self._load_instrument()
 
-            # Start background tasks
-            tasks = [
-                asyncio.create_task(self._stream_orderbook()),
-                asyncio.create_task(self._stream_private_data()),
-                asyncio.create_task(self._main_loop()),
-            ]
-
-            self._running = True
-            logger.info("Market maker started")
-
-            # Wait for shutdown signal
-            await self._shutdown_event.wait()
-
-            # Cancel all tasks
-            for task in tasks:
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+            # Run background tasks until shutdown
+            await self._run_tasks()
 
         except Exception as e:
             logger.error(f"Market maker error: {e}")
@@ -175,6 +172,27 @@ class MarketMaker:
         finally:
             await self._shutdown()
 
+    async def _run_tasks(self) -> None:
+        """Run streaming and strategy tasks until shutdown is requested.
+
+        The tasks share a TaskGroup, so an unexpected failure in any of them
+        cancels the others and propagates immediately.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._stream_orderbook())
+                tg.create_task(self._stream_private_data())
+                tg.create_task(self._main_loop())
+
+                self._running = True
+                logger.info("Market maker started")
+
+                # Wait for shutdown signal, then cancel all tasks
+                await self._shutdown_event.wait()
+                raise _ShutdownRequested
+        except* _ShutdownRequested:
+            pass
+
     async def _initialize_services(self) -> None:
         """Initialize all services and connections."""
         # HTTP client for REST API
@@ -236,8 +254,8 @@ class MarketMaker:
                 depth=5,
             ):
                 ob, _ = orderbook
-                async with self.context.lock:
-                    self.context.update_orderbook(ob)
+                # update_* never awaits, so it cannot interleave with the main loop
+                self.context.update_orderbook(ob)
 
         except asyncio.CancelledError:
             logger.debug("Orderbook streaming cancelled")
@@ -250,17 +268,19 @@ class MarketMaker:
         streaming_service = PrivateStreamingService(self._private_ws)
 
         try:
-            # Subscribe to balance_and_position for efficiency
-            async for update in streaming_service.stream_balance_and_position():
-                async with self.context.lock:
-                    # Update balances
-                    if update.balances:
-                        # Create minimal account balance update
-                        pass  # Handled by balance update
-
-                    # Update positions
-                    for position in update.positions:
-                        self.context.update_position(position)
+            # Subscribe to balance_and_position for efficiency; only our
+            # instrument's positions are parsed
+            async for update in streaming_service.stream_balance_and_position(
+                inst_id=self.settings.inst_id,
+            ):
+                # Update balances
+                if update.balances:
+                    # Create minimal account balance update
+                    pass  # Handled by balance update
+
+                # Update positions
+                for position in update.positions:
+                    self.context.update_position(position)
 
         except asyncio.CancelledError:
             logger.debug("Private streaming cancelled")
@@ -274,7 +294,12 @@ class MarketMaker:
 
         try:
             while self._running:
-                await asyncio.sleep(interval)
+                # Wait out the interval, or less if the book moves enough to requote
+                try:
+                    await asyncio.wait_for(self.context.book_moved.wait(), timeout=interval)
+                except TimeoutError:
+                    pass
+                self.context.mark_decided()
 
                 # Health check
                 health = self._health_checker.check(self.context)
@@ -289,23 +314,50 @@ class MarketMaker:
                         return
                     continue
 
-                # Get strategy decision
-                decision = self.strategy.decide(self.context)
-
-                if decision.should_halt:
-                    logger.warning(f"Strategy halt: {decision.halt_reason}")
-                    await self._cancel_all_orders()
-                    continue
-
-                # Execute decision
-                if decision.has_actions:
-                    await self._order_handler.execute_decision(decision)
-
-                # Cleanup terminal orders
-                self._order_handler.cleanup_terminal_orders()
-
-                # Log status periodically
-                self._log_status()
+                # Get strategy decision, unless nothing it reads has changed
+                # since a decision that required no action. Book updates only
+                # count when they move the top of book or the price history.
+                # Time-based staleness is covered by the health check above.
+                decision_key = (
+                    self.context.best_bid,
+                    self.context.best_ask,
+                    self.context.price_seq,
+                    self.context.position_seq,
+                    self.context.order_seq,
+                    self.context.net_position,
+                )
+                if decision_key != self._idle_decision_key:
+                    decision = self.strategy.decide(self.context)
+
+                    if decision.should_halt:
+                        self._idle_decision_key = None
+                        logger.warning(f"Strategy halt: {decision.halt_reason}")
+                        await self._cancel_all_orders()
+                        continue
+
+                    # Execute decision
+                    if decision.has_actions:
+                        self._idle_decision_key = None
+                        await self._order_handler.execute_decision(decision)
+                    else:
+                        self._idle_decision_key = decision_key
+
+                # Debug runs verify the active-order indexes every iteration
+                if self.settings.debug_checks:
+                    self.context.check_exposure()
+
+                # Sweep closed orders whose final push never arrived, on a
+                # cadence of its own (not tied to logging)
+                now = time.monotonic()
+                grace_sec = self.settings.terminal_order_grace_sec
+                if now - self._last_cleanup_mono >= grace_sec:
+                    self._last_cleanup_mono = now
+                    self._order_handler.cleanup_terminal_orders()
+
+                # Status log at most every log_interval_sec
+                if now - self._last_log_mono >= self.settings.log_interval_sec:
+                    self._last_log_mono = now
+                    self._log_status()
 
         except asyncio.CancelledError:
             logger.debug("Main loop cancelled")
@@ -321,12 +373,16 @@ class MarketMaker:
 
     def _log_status(self) -> None:
         """Log current status."""
+        # Skip the risk calculation entirely when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
         metrics = self._risk_calculator.calculate(self.context)
         logger.info(
-            f"Status: pos={metrics.net_position} "
-            f"buys={self.context.num_active_buy_orders} "
-            f"sells={self.context.num_active_sell_orders} "
-            f"pnl={metrics.total_pnl:.4f}"
+            "Status: pos=%s buys=%d sells=%d pnl=%.4f",
+            metrics.net_position,
+            self.context.num_active_buy_orders,
+            self.context.num_active_sell_orders,
+            metrics.total_pnl,
         )
 
     def _handle_shutdown(self) -> None:
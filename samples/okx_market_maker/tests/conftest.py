@@ -0,0 +1,35 @@
+"""Shared fixtures for market maker tests."""
+
+from collections.abc import Callable, Iterable
+from decimal import Decimal
+from typing import NamedTuple
+
+import pytest
+
+
+class Level(NamedTuple):
+    """Orderbook level stub; the context only reads price."""
+
+    price: Decimal
+    size: Decimal = Decimal("1")
+
+
+class Book(NamedTuple):
+    """Orderbook stub with just the sides the context reads."""
+
+    bids: list[Level]
+    asks: list[Level]
+
+
+def _book(bids: Iterable[Decimal | int] = (), asks: Iterable[Decimal | int] = ()) -> Book:
+    """Build a stub orderbook from bid and ask prices, best first."""
+    return Book(
+        bids=[Level(Decimal(price)) for price in bids],
+        asks=[Level(Decimal(price)) for price in asks],
+    )
+
+
+@pytest.fixture(scope="session")
+def make_book() -> Callable[..., Book]:
+    """Provide a factory for stub orderbooks (picklable, unlike MagicMock)."""
+    return _book
@@ -1,41 +1,51 @@
 """Tests for market context and models."""
 
+import asyncio
+import os
+from collections.abc import Callable
 from decimal import Decimal
+from types import SimpleNamespace
+from typing import NamedTuple
 
 import pytest
 
 from samples.okx_market_maker.application.context.market_context import MarketContext
-from samples.okx_market_maker.domain.enums import OrderState
+from samples.okx_market_maker.application.services.health_checker import HealthChecker
+from samples.okx_market_maker.application.services.order_handler import OrderHandler
+from samples.okx_market_maker.core.config.settings import MarketMakerSettings
+from samples.okx_market_maker.core.utils.id_generator import (
+    OrderIdGenerator,
+    generate_client_order_id,
+)
+from samples.okx_market_maker.domain.enums import (
+    TERMINAL_ORDER_STATES,
+    TERMINAL_STATE_MASK,
+    OrderState,
+    Side,
+)
 from samples.okx_market_maker.domain.models.amend_request import AmendRequest
+from samples.okx_market_maker.domain.models.quote import Quote, StrategyDecision
 from samples.okx_market_maker.domain.models.strategy_order import StrategyOrder
 
 
 class TestMarketContext:
     """Tests for MarketContext."""
 
-    def test_mid_price_calculation(self) -> None:
+    def test_mid_price_calculation(self, make_book: Callable[..., NamedTuple]) -> None:
         """Test mid price calculation from orderbook."""
-        from unittest.mock import MagicMock
-
         context = MarketContext(inst_id="BTC-USDT")
 
-        orderbook = MagicMock()
-        orderbook.bids = [MagicMock(price=Decimal("50000"))]
-        orderbook.asks = [MagicMock(price=Decimal("50010"))]
+        orderbook = make_book([Decimal("50000")], [Decimal("50010")])
 
         context.update_orderbook(orderbook)
 
         assert context.mid_price == Decimal("50005")
 
-    def test_spread_calculation(self) -> None:
+    def test_spread_calculation(self, make_book: Callable[..., NamedTuple]) -> None:
         """Test spread calculation."""
-        from unittest.mock import MagicMock
-
         context = MarketContext(inst_id="BTC-USDT")
 
-        orderbook = MagicMock()
-        orderbook.bids = [MagicMock(price=Decimal("50000"))]
-        orderbook.asks = [MagicMock(price=Decimal("50010"))]
+        orderbook = make_book([Decimal("50000")], [Decimal("50010")])
 
         context.update_orderbook(orderbook)
 
@@ -109,6 +119,12 @@ class TestMarketContext:
         assert len(context.active_buy_orders) == 1
         assert len(context.active_sell_orders) == 1
 
+        # Orders that go terminal after being tracked drop out of the side view
+        buy_order.mark_canceled()
+        assert context.active_buy_orders == []
+        assert context.num_active_buy_orders == 0
+        assert context.num_active_sell_orders == 1
+
     def test_clear_terminal_orders(self) -> None:
         """Test clearing filled/canceled orders."""
         context = MarketContext(inst_id="BTC-USDT")
@@ -140,6 +156,442 @@ class TestMarketContext:
         assert context.get_order("live_001") is not None
         assert context.get_order("filled_001") is None
 
+    def test_data_freshness_uses_monotonic_clock(self, make_book: Callable[..., NamedTuple]) -> None:
+        """Test freshness checks against an explicit monotonic time."""
+        context = MarketContext(inst_id="BTC-USDT")
+
+        # No data yet: orderbook/account stale, positions ok
+        assert not context.is_orderbook_fresh()
+        assert not context.is_account_fresh()
+        assert context.is_position_fresh()
+        assert context.orderbook_age() == float("inf")
+
+        context.update_orderbook(make_book())
+        updated_at = context._orderbook_mono
+
+        assert context.is_orderbook_fresh(5.0, now=updated_at + 4.0)
+        assert not context.is_orderbook_fresh(5.0, now=updated_at + 6.0)
+        assert context.orderbook_age(now=updated_at + 2.5) == 2.5
+
+    def test_freshness_snapshot_matches_individual_checks(self, make_book: Callable[..., NamedTuple]) -> None:
+        """Test that freshness_snapshot agrees with the is_*_fresh methods."""
+        context = MarketContext(inst_id="BTC-USDT")
+        assert context.freshness_snapshot(5.0, 10.0, 10.0, 0.0) == (False, False, True)
+
+        context.update_orderbook(make_book())
+        context.update_account(SimpleNamespace())
+        context.update_position(SimpleNamespace(inst_id="BTC-USDT"))
+        updated_at = context._orderbook_mono
+        assert updated_at is not None
+
+        for now in (updated_at + 1.0, updated_at + 7.0, updated_at + 20.0):
+            assert context.freshness_snapshot(5.0, 10.0, 10.0, now) == (
+                context.is_orderbook_fresh(5.0, now),
+                context.is_account_fresh(10.0, now),
+                context.is_position_fresh(10.0, now),
+            )
+
+    def test_price_history_is_bounded(self, make_book: Callable[..., NamedTuple]) -> None:
+        """Test that recent prices keep only the last max_price_history entries."""
+        context = MarketContext(inst_id="BTC-USDT", max_price_history=3)
+
+        for bid in range(50000, 50005):
+            orderbook = make_book([Decimal(bid)], [Decimal(bid + 10)])
+            context.update_orderbook(orderbook)
+
+        assert list(context.recent_prices) == [
+            Decimal("50007"),
+            Decimal("50008"),
+            Decimal("50009"),
+        ]
+
+    def test_unchanged_mid_is_not_recorded(self, make_book: Callable[..., NamedTuple]) -> None:
+        """Test that book updates with the same mid price are not appended."""
+        context = MarketContext(inst_id="BTC-USDT")
+
+        for bid in (50000, 50000, 50001, 50001, 50000):
+            orderbook = make_book([Decimal(bid)], [Decimal(bid + 10)])
+            context.update_orderbook(orderbook)
+
+        assert list(context.recent_prices) == [
+            Decimal("50005"),
+            Decimal("50006"),
+            Decimal("50005"),
+        ]
+        assert context.orderbook_seq == 5
+        assert context.price_seq == 3
+
+    def test_book_moved_set_outside_requote_band(self, make_book: Callable[..., NamedTuple]) -> None:
+        """Test that book_moved fires only once the mid leaves the requote band."""
+        context = MarketContext(inst_id="BTC-USDT", requote_move_pct=0.001)
+
+        def update(bid: int) -> None:
+            orderbook = make_book([Decimal(bid)], [Decimal(bid + 10)])
+            context.update_orderbook(orderbook)
+
+        update(49995)
+        assert not context.book_moved.is_set()
+
+        context.mark_decided()
+        update(50040)
+        assert not context.book_moved.is_set()
+
+        update(50060)
+        assert context.book_moved.is_set()
+
+        context.mark_decided()
+        assert not context.book_moved.is_set()
+
+    def test_volatility_is_reused_until_prices_change(self, make_book: Callable[..., NamedTuple]) -> None:
+        """Test that volatility is cached per price-history state."""
+        context = MarketContext(inst_id="BTC-USDT")
+        context.recent_prices = [Decimal("100"), Decimal("110"), Decimal("99")]
+
+        first = context.calculate_volatility(lookback=2)
+        assert context.calculate_volatility(lookback=2) == first
+        assert context.calculate_volatility(lookback=3) is None
+
+        orderbook = make_book([Decimal("99")], [Decimal("101")])
+        context.update_orderbook(orderbook)
+
+        assert context.calculate_volatility(lookback=3) is not None
+
+        # A full history keeps its length on update but still invalidates
+        full = MarketContext(inst_id="BTC-USDT", max_price_history=3)
+        full.recent_prices = [Decimal("100"), Decimal("110"), Decimal("99")]
+        before = full.calculate_volatility(lookback=2)
+        full.update_orderbook(make_book([Decimal("150")], [Decimal("150")]))
+        assert len(full.recent_prices) == 3
+        assert full.calculate_volatility(lookback=2) != before
+
+    def test_calculate_volatility(self) -> None:
+        """Test volatility as standard deviation of trailing returns."""
+        context = MarketContext(inst_id="BTC-USDT")
+        context.recent_prices = [Decimal("1"), Decimal("100"), Decimal("110"), Decimal("99")]
+
+        # Returns over lookback window: +10%, -10%
+        volatility = context.calculate_volatility(lookback=2)
+
+        assert volatility is not None
+        assert isinstance(volatility, Decimal)
+        assert volatility == pytest.approx(Decimal("0.1"))
+        assert context.calculate_volatility(lookback=4) is None
+
+    def test_exposure_tracks_order_lifecycle(self) -> None:
+        """Test running exposure through add, amend, cancel and removal."""
+        context = MarketContext(inst_id="BTC-USDT")
+        buy = StrategyOrder(
+            cl_ord_id="b1", inst_id="BTC-USDT", side="buy",
+            price=Decimal("50000"), size=Decimal("0.002"),
+        )
+        sell = StrategyOrder(
+            cl_ord_id="s1", inst_id="BTC-USDT", side="sell",
+            price=Decimal("51000"), size=Decimal("0.001"),
+        )
+        context.add_order(buy)
+        context.add_order(sell)
+        assert context.buy_exposure == Decimal("100")
+        assert context.sell_exposure == Decimal("51")
+
+        # Amend applied in place, then re-indexed
+        buy.mark_sent()
+        buy.mark_ack("ex_1")
+        buy.mark_live()
+        buy.price = Decimal("40000")
+        context.refresh_order(buy)
+        assert context.buy_exposure == Decimal("80")
+
+        context.check_exposure()
+
+        # Reading the active orders leaves the totals alone
+        context.partition_active_orders()
+        assert context.buy_exposure == Decimal("80")
+
+        # A terminal transition leaves the totals when the order is refreshed
+        buy.mark_canceled()
+        context.refresh_order(buy)
+        assert context.buy_exposure == Decimal("0")
+        assert context.active_buy_orders == []
+
+        context.remove_order("s1")
+        assert context.sell_exposure == Decimal("0")
+        context.check_exposure()
+
+    def test_check_exposure_detects_drift(self) -> None:
+        """Test that the exposure check flags a running total out of sync."""
+        context = MarketContext(inst_id="BTC-USDT")
+        order = StrategyOrder(
+            cl_ord_id="b1", inst_id="BTC-USDT", side="buy",
+            price=Decimal("50000"), size=Decimal("0.001"),
+        )
+        context.add_order(order)
+
+        # Mutating a tracked order without refresh_order desyncs the total
+        order.size = Decimal("0.002")
+
+        with pytest.raises(AssertionError, match="buy exposure drifted"):
+            context.check_exposure()
+
+    def test_order_seq_tracks_order_set_changes(self) -> None:
+        """Test that order_seq bumps when tracked orders change."""
+        context = MarketContext(inst_id="BTC-USDT")
+        order = StrategyOrder(
+            cl_ord_id="b1", inst_id="BTC-USDT", side="buy",
+            price=Decimal("50000"), size=Decimal("0.001"),
+        )
+
+        context.add_order(order)
+        assert context.order_seq == 1
+
+        order.price = Decimal("49000")
+        context.refresh_order(order)
+        assert context.order_seq == 2
+
+        assert context.remove_order("missing") is None
+        assert context.order_seq == 2
+
+        context.remove_order("b1")
+        assert context.order_seq == 3
+
+    def test_quantizer_follows_instrument(self) -> None:
+        """Test that the cached quantizer is rebuilt when the instrument changes."""
+        context = MarketContext(inst_id="BTC-USDT")
+        assert context.quantizer is context.quantizer
+        assert context.quantizer.tick_size == Decimal("0.01")
+
+        context.update_instrument(SimpleNamespace(tick_sz=Decimal("0.1"), lot_sz=Decimal("0.001")))
+
+        assert context.quantizer.tick_size == Decimal("0.1")
+        assert context.quantizer.lot_size == Decimal("0.001")
+
+
+class TestHealthChecker:
+    """Tests for HealthChecker."""
+
+    def test_check_reuses_status_within_min_interval(self, make_book: Callable[..., NamedTuple]) -> None:
+        """Test that repeated checks with unchanged data return cached status."""
+        checker = HealthChecker(MarketMakerSettings(health_check_min_interval_sec=60.0))
+        context = MarketContext(inst_id="BTC-USDT")
+
+        first = checker.check(context)
+        assert not first.is_healthy
+        assert checker.check(context) is first
+        # A reused failure still counts towards the emergency stop
+        assert checker.consecutive_failures == 2
+
+        # New data, or a different context, invalidates the cached status
+        context.update_orderbook(make_book())
+        second = checker.check(context)
+        assert second is not first
+        assert checker.check(MarketContext(inst_id="BTC-USDT")) is not second
+        assert checker.consecutive_failures == 4
+
+    def test_check_reports_issues_only_when_unhealthy(self, make_book: Callable[..., NamedTuple]) -> None:
+        """Test issue messages for missing data and an empty healthy result."""
+        checker = HealthChecker(MarketMakerSettings(health_check_min_interval_sec=0.0))
+        context = MarketContext(inst_id="BTC-USDT")
+
+        status = checker.check(context)
+        assert "No orderbook data" in status.issues
+        assert "Cannot calculate mid price" in status.issues
+        assert checker.consecutive_failures == 1
+
+        orderbook = make_book([Decimal("50000")], [Decimal("50010")])
+        context.update_orderbook(orderbook)
+        context.update_account(SimpleNamespace())
+
+        status = checker.check(context)
+        assert status.is_healthy
+        assert status.issues == ()
+        assert checker.consecutive_failures == 0
+
+    def test_healthy_status_reused_until_data_ages_out(self, make_book: Callable[..., NamedTuple]) -> None:
+        """Test that a healthy status is reused until its data would go stale."""
+        import time
+        from unittest.mock import patch
+
+        checker = HealthChecker(MarketMakerSettings(health_check_min_interval_sec=0.0))
+        context = MarketContext(inst_id="BTC-USDT")
+        context.update_orderbook(make_book())
+        context.update_account(SimpleNamespace())
+        expires = context.fresh_until(5.0, 10.0, 10.0)
+        assert expires == context._orderbook_mono + 5.0
+
+        first = checker.check(context)
+        assert first.is_healthy
+        with patch.object(time, "monotonic", return_value=expires - 0.1):
+            assert checker.check(context) is first
+
+        # Same data, but the orderbook has aged past its limit
+        with patch.object(time, "monotonic", return_value=expires + 0.1):
+            status = checker.check(context)
+        assert not status.orderbook_ok
+        assert checker.consecutive_failures == 1
+
+
+class TestOrderHandler:
+    """Tests for OrderHandler order tracking."""
+
+    def test_terminal_update_stops_tracking_order(self) -> None:
+        """Test that an order is dropped as soon as the exchange reports it done."""
+        from unittest.mock import MagicMock
+
+        context = MarketContext(inst_id="BTC-USDT")
+        handler = OrderHandler(MagicMock(), MarketMakerSettings(), context)
+        for cl_ord_id in ("o1", "o2"):
+            context.add_order(StrategyOrder(
+                cl_ord_id=cl_ord_id, inst_id="BTC-USDT", side="buy",
+                price=Decimal("50000"), size=Decimal("0.001"),
+            ))
+
+        def update(cl_ord_id: str, state: str) -> MagicMock:
+            return MagicMock(
+                cl_ord_id=cl_ord_id,
+                state=MagicMock(value=state),
+                acc_fill_sz=Decimal("0"),
+                avg_px=None,
+                ord_id=f"ex_{cl_ord_id}",
+                fill_sz=Decimal("0"),
+            )
+
+        handler.on_order_update(update("o1", "live"))
+        handler.on_order_update(update("o2", "canceled"))
+
+        assert context.get_order("o1") is not None
+        assert context.get_order("o2") is None
+
+        # An order that goes terminal outside the handler is swept once the
+        # grace period has passed
+        straggler = context.get_order("o1")
+        straggler.mark_canceled()
+        assert handler.cleanup_terminal_orders() == 0
+        straggler.updated_at -= 60 * 1_000_000_000
+        assert handler.cleanup_terminal_orders() == 1
+
+    def test_fill_after_cancel_ack_reaches_position(self) -> None:
+        """Test that fills racing a cancel still count toward the position."""
+        from unittest.mock import MagicMock
+
+        async def cancel_batch_orders(batch: list[dict[str, str]]) -> list[dict[str, str]]:
+            return [{"sCode": "0"} for _ in batch]
+
+        context = MarketContext(inst_id="BTC-USDT")
+        handler = OrderHandler(
+            MagicMock(cancel_batch_orders=cancel_batch_orders), MarketMakerSettings(), context
+        )
+        order = StrategyOrder(
+            cl_ord_id=handler._id_generator.next(), inst_id="BTC-USDT", side="buy",
+            price=Decimal("50000"), size=Decimal("0.001"),
+        )
+        order.mark_sent()
+        order.mark_ack("ex_1")
+        order.mark_live()
+        context.add_order(order)
+
+        def update(
+            cl_ord_id: str, state: str, fill_sz: str, acc_fill_sz: str, side: str = "buy"
+        ) -> MagicMock:
+            return MagicMock(
+                cl_ord_id=cl_ord_id,
+                state=MagicMock(value=state),
+                side=MagicMock(value=side),
+                acc_fill_sz=Decimal(acc_fill_sz),
+                avg_px=Decimal("50000"),
+                ord_id="ex_1",
+                fill_sz=Decimal(fill_sz),
+                fill_px=Decimal("50000"),
+            )
+
+        asyncio.run(handler.execute_decision(StrategyDecision(orders_to_cancel=(order.cl_ord_id,))))
+
+        # Canceled over REST: out of the active index, still tracked
+        assert order.is_canceled
+        assert context.get_order(order.cl_ord_id) is order
+        assert context.buy_exposure == Decimal("0")
+
+        # A partial fill sent before the cancel lands afterwards
+        handler.on_order_update(update(order.cl_ord_id, "partially_filled", "0.0004", "0.0004"))
+        assert context.net_position == Decimal("0.0004")
+        assert order.is_canceled
+
+        # The final push stops tracking
+        handler.on_order_update(update(order.cl_ord_id, "canceled", "0", "0.0004"))
+        assert context.get_order(order.cl_ord_id) is None
+
+        # Fills for this run's untracked orders still count; others' do not
+        handler.on_order_update(
+            update(handler._id_generator.next(), "filled", "0.0001", "0.0001", side="sell")
+        )
+        handler.on_order_update(update("foreign1", "filled", "0.0001", "0.0001"))
+        assert context.net_position == Decimal("0.0003")
+
+    def test_concurrent_cancel_place_overlaps_requests(self) -> None:
+        """Test that places are sent while cancels are in flight when enabled."""
+        from unittest.mock import MagicMock
+
+        calls: list[str] = []
+
+        async def cancel_batch_orders(batch: list[dict[str, str]]) -> list[dict]:
+            calls.append("cancel_sent")
+            await asyncio.sleep(0)
+            calls.append("cancel_done")
+            return [{"sCode": "0"} for _ in batch]
+
+        async def place_batch_orders(batch: list) -> list[dict]:
+            calls.append("place_sent")
+            return [{"sCode": "0", "ordId": "x"} for _ in batch]
+
+        trade_service = MagicMock(
+            cancel_batch_orders=cancel_batch_orders,
+            place_batch_orders=place_batch_orders,
+        )
+        context = MarketContext(inst_id="BTC-USDT")
+        old = StrategyOrder(
+            cl_ord_id="old", inst_id="BTC-USDT", side="buy",
+            price=Decimal("49000"), size=Decimal("0.001"),
+        )
+        old.mark_sent()
+        old.mark_ack("ex_old")
+        old.mark_live()
+        context.add_order(old)
+        decision = StrategyDecision(
+            orders_to_place=(Quote(price=Decimal("49500"), size=Decimal("0.001"), side="buy"),),
+            orders_to_cancel=("old",),
+        )
+        settings = MarketMakerSettings(concurrent_cancel_place=True)
+
+        asyncio.run(OrderHandler(trade_service, settings, context).execute_decision(decision))
+
+        assert calls == ["cancel_sent", "place_sent", "cancel_done"]
+        assert context.get_order("old").is_canceled
+
+    @pytest.mark.parametrize(("limit", "expected_peak"), [(1, 1), (4, 3)])
+    def test_batches_in_flight_are_bounded(self, limit: int, expected_peak: int) -> None:
+        """Test that concurrent batch requests respect max_concurrent_batches."""
+        from unittest.mock import MagicMock
+
+        in_flight = peak = 0
+
+        async def place_batch_orders(batch: list) -> list[dict]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [{"sCode": "0", "ordId": "x"} for _ in batch]
+
+        settings = MarketMakerSettings(max_concurrent_batches=limit)
+        handler = OrderHandler(
+            MagicMock(place_batch_orders=place_batch_orders),
+            settings,
+            MarketContext(inst_id="BTC-USDT"),
+        )
+        quote = Quote(price=Decimal("49500"), size=Decimal("0.001"), side="buy")
+
+        asyncio.run(handler.execute_decision(StrategyDecision(orders_to_place=(quote,) * 45)))
+
+        assert peak == expected_peak
+
 
 class TestStrategyOrder:
     """Tests for StrategyOrder state machine."""
@@ -158,6 +610,32 @@ class TestStrategyOrder:
         assert order.is_pending
         assert order.is_active
 
+    def test_side_is_normalized(self) -> None:
+        """Test that plain side strings are normalized to Side members."""
+        order = StrategyOrder(
+            cl_ord_id="test_001",
+            inst_id="BTC-USDT",
+            side="sell",
+            price=Decimal("50000"),
+            size=Decimal("0.001"),
+        )
+
+        assert order.side is Side.SELL
+        assert order.side == "sell"
+        assert order.is_sell
+
+    def test_state_labels(self) -> None:
+        """Test that int-valued states keep their serialized labels."""
+        assert OrderState.PARTIALLY_FILLED.label == "partial"
+        assert OrderState(OrderState.LIVE) is OrderState.LIVE
+        assert len({state.label for state in OrderState}) == len(OrderState)
+
+    def test_terminal_mask_matches_terminal_states(self) -> None:
+        """Test that the terminal bitmask agrees with TERMINAL_ORDER_STATES."""
+        for state in OrderState:
+            is_terminal = bool(state.flag & TERMINAL_STATE_MASK)
+            assert is_terminal == (state in TERMINAL_ORDER_STATES)
+
     def test_state_transitions(self) -> None:
         """Test valid state transitions."""
         order = StrategyOrder(
@@ -274,6 +752,83 @@ class TestStrategyOrder:
         assert d["price"] == "50000"
         assert d["state"] == "pending"
 
+    def test_to_dict_lazy_matches_to_dict(self) -> None:
+        """Test that the lazy view formats the same values as to_dict."""
+        order = StrategyOrder(
+            cl_ord_id="test_001",
+            inst_id="BTC-USDT",
+            side="buy",
+            price=Decimal("50000"),
+            size=Decimal("0.001"),
+        )
+
+        view = order.to_dict_lazy()
+
+        assert view["price"] == "50000"
+        assert dict(view) == order.to_dict()
+
+    def test_effective_price_follows_amendment(self) -> None:
+        """Test effective price/size switch to amend values only while amending."""
+        order = StrategyOrder(
+            cl_ord_id="test_001",
+            inst_id="BTC-USDT",
+            side="buy",
+            price=Decimal("50000"),
+            size=Decimal("0.001"),
+        )
+        order.mark_sent()
+        order.mark_ack("exchange_123")
+        order.mark_live()
+        assert order.effective_price == Decimal("50000")
+
+        order.mark_amending(new_price=Decimal("50100"))
+        assert order.effective_price == Decimal("50100")
+        assert order.effective_size == Decimal("0.001")
+
+        order.mark_canceled()
+        assert order.effective_price == Decimal("50000")
+
+        # Direct field assignment (as an amend ack does) is reflected at once
+        order.price = Decimal("49900")
+        assert order.effective_price == Decimal("49900")
+
+    def test_update_from_exchange_maps_states(self) -> None:
+        """Test exchange state strings map to OrderState, unknown ones are ignored."""
+        order = StrategyOrder(
+            cl_ord_id="test_001",
+            inst_id="BTC-USDT",
+            side="buy",
+            price=Decimal("50000"),
+            size=Decimal("0.001"),
+        )
+
+        order.update_from_exchange(state="partially_filled", filled_size=Decimal("0.0005"))
+        assert order.state is OrderState.PARTIALLY_FILLED
+
+        order.update_from_exchange(state="unknown")
+        assert order.state is OrderState.PARTIALLY_FILLED
+
+        order.update_from_exchange(state="mmp_canceled")
+        assert order.state is OrderState.CANCELED
+
+    def test_batch_timestamp(self) -> None:
+        """Test that a shared timestamp can be applied to a batch of updates."""
+        from datetime import UTC, datetime
+
+        order = StrategyOrder(
+            cl_ord_id="test_001",
+            inst_id="BTC-USDT",
+            side="buy",
+            price=Decimal("50000"),
+            size=Decimal("0.001"),
+        )
+        order.update_from_exchange(state="live", now_ns=1_700_000_000_000_000_000)
+        order.record_fill(Decimal("0.001"), Decimal("50000"), now_ns=1_700_000_000_000_000_000)
+
+        assert order.updated_at == 1_700_000_000_000_000_000
+        assert order.updated_at_dt == datetime(2023, 11, 14, 22, 13, 20, tzinfo=UTC)
+        assert order.to_dict()["updated_at"] == "2023-11-14T22:13:20+00:00"
+
 
 class TestAmendRequest:
     """Tests for AmendRequest typed POD object."""
@@ -378,3 +933,46 @@ class TestAmendRequest:
         assert amend.cl_ord_id == "mm_000001"
         assert amend.new_px == Decimal("50100.50")
         assert amend.new_sz == Decimal("0.00123")
+
+
+class TestOrderIdGenerator:
+    """Tests for client order ID generation."""
+
+    def test_ids_are_sequential_alphanumeric_and_session_scoped(self) -> None:
+        """Test that IDs count up within a session and differ across sessions."""
+        gen = OrderIdGenerator(prefix="mm", session="0a1b2c3d")
+
+        assert gen.next() == "mm0a1b2c3d00000001"
+        assert gen.next() == "mm0a1b2c3d00000002"
+        assert gen.current == 3
+
+        first, second = OrderIdGenerator().next(), OrderIdGenerator().next()
+        assert first.isalnum() and len(first) <= 32
+        assert first != second
+
+    def test_client_order_ids_stay_unique_across_entropy_refills(self) -> None:
+        """Test the timestamped ID format and uniqueness past one entropy buffer."""
+        ids = [generate_client_order_id("mm") for _ in range(1200)]
+
+        prefix, timestamp_ms, suffix = ids[0].split("_")
+        assert prefix == "mm" and timestamp_ms.isdigit()
+        assert len(suffix) == 8 and int(suffix, 16) >= 0
+        assert len(set(ids)) == len(ids)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_draws_its_own_suffixes(self) -> None:
+        """Test that a forked child does not replay the parent's buffered suffixes."""
+        generate_client_order_id()  # fill the parent's buffer
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, generate_client_order_id().rsplit("_", 1)[1].encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            child_suffix = pipe.read()
+        os.waitpid(pid, 0)
+
+        assert len(child_suffix) == 8
+        assert child_suffix != generate_client_order_id().rsplit("_", 1)[1]
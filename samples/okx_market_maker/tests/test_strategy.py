@@ -1,11 +1,19 @@
 """Tests for market maker strategies."""
 
+from collections.abc import Callable
 from decimal import Decimal
+from types import SimpleNamespace
+from typing import NamedTuple
 
 import pytest
 
 from samples.okx_market_maker.application.context.market_context import MarketContext
 from samples.okx_market_maker.core.config.settings import MarketMakerSettings
+from samples.okx_market_maker.core.utils.instrument_util import Quantizer
+from samples.okx_market_maker.domain.enums import Side
+from samples.okx_market_maker.domain.models.quote import Quote, StrategyDecision
+from samples.okx_market_maker.domain.models.strategy_order import StrategyOrder
+from samples.okx_market_maker.domain.services.risk_calculator import RiskCalculator
 from samples.okx_market_maker.domain.strategies.grid_strategy import (
     SampleMMStrategy,
 )
@@ -17,9 +25,20 @@ from samples.okx_market_maker.domain.strategies.volatility_strategy import (
 )
 
 
-@pytest.fixture
+def _avg_price(quotes: list[Quote], side: Side) -> Decimal:
+    """Average quote price on one side in a single pass (0 if none)."""
+    total = Decimal("0")
+    count = 0
+    for quote in quotes:
+        if quote.side is side:
+            total += quote.price
+            count += 1
+    return total / max(1, count)
+
+
+@pytest.fixture(scope="module")
 def settings() -> MarketMakerSettings:
-    """Create test settings."""
+    """Create test settings (shared; tests only read them)."""
     return MarketMakerSettings(
         inst_id="BTC-USDT",
         step_pct=Decimal("0.001"),
@@ -35,29 +54,16 @@ def settings() -> MarketMakerSettings:
 
 
 @pytest.fixture
-def context() -> MarketContext:
-    """Create test context with mock orderbook."""
+def context(make_book: Callable[..., NamedTuple]) -> MarketContext:
+    """Create test context with a stub orderbook."""
     ctx = MarketContext(inst_id="BTC-USDT")
 
-    # Create mock orderbook
-    from unittest.mock import MagicMock
-
-    orderbook = MagicMock()
-    orderbook.bids = [
-        MagicMock(price=Decimal("50000"), size=Decimal("1")),
-        MagicMock(price=Decimal("49990"), size=Decimal("2")),
-    ]
-    orderbook.asks = [
-        MagicMock(price=Decimal("50010"), size=Decimal("1")),
-        MagicMock(price=Decimal("50020"), size=Decimal("2")),
-    ]
-
+    # Create stub orderbook
+    orderbook = make_book([50000, 49990], [50010, 50020])
     ctx.update_orderbook(orderbook)
 
-    # Create mock account
-    account = MagicMock()
-    account.total_eq = Decimal("10000")
-    ctx.update_account(account)
+    # Create stub account
+    ctx.update_account(SimpleNamespace(total_eq=Decimal("10000")))
 
     return ctx
 
@@ -118,6 +124,47 @@ class TestSampleMMStrategy:
 
         assert not decision.should_halt
         assert len(decision.orders_to_place) > 0
+        assert decision.num_buys_to_place == 3
+        assert decision.num_sells_to_place == 3
+        assert decision.has_actions
+        assert not StrategyDecision().has_actions
+        with pytest.raises(AttributeError):
+            decision.orders_to_place.append(decision.orders_to_place[0])
+
+    def test_match_orders_keeps_orders_within_one_tick(
+        self,
+        settings: MarketMakerSettings,
+        context: MarketContext,
+    ) -> None:
+        """Test that matching keeps near orders and replaces the rest."""
+        strategy = SampleMMStrategy(settings)
+        for cl_ord_id, price in (("b1", "100.00"), ("b2", "99.00"), ("b3", "98.00")):
+            context.add_order(StrategyOrder(
+                cl_ord_id=cl_ord_id, inst_id="BTC-USDT", side="buy",
+                price=Decimal(price), size=Decimal("0.001"),
+            ))
+        quotes = [
+            Quote(price=Decimal(price), size=Decimal("0.001"), side=Side.BUY)
+            for price in ("100.01", "98.50", "97.99")
+        ]
+
+        decision = strategy._match_orders(context, quotes)
+
+        assert decision.orders_to_place == (quotes[1],)
+        assert decision.orders_to_cancel == ("b2",)
+
+    def test_compute_quotes_batch_matches_single(
+        self,
+        settings: MarketMakerSettings,
+        context: MarketContext,
+    ) -> None:
+        """Test that batch quoting returns per-context compute_quotes results."""
+        strategy = SampleMMStrategy(settings)
+        empty = MarketContext(inst_id="ETH-USDT")
+
+        batch = strategy.compute_quotes_batch([context, empty])
+
+        assert batch == [strategy.compute_quotes(context), []]
 
 
 class TestInventorySkewStrategy:
@@ -140,10 +187,8 @@ class TestInventorySkewStrategy:
         quotes_long = strategy.compute_quotes(context)
 
         # Compare average buy prices - should be lower when long
-        avg_buy_neutral = sum(q.price for q in quotes_neutral if q.side == "buy") / 3
-        avg_buy_long = sum(q.price for q in quotes_long if q.side == "buy") / max(
-            1, len([q for q in quotes_long if q.side == "buy"])
-        )
+        avg_buy_neutral = _avg_price(quotes_neutral, Side.BUY)
+        avg_buy_long = _avg_price(quotes_long, Side.BUY)
 
         # Prices should be lower (skewed down) when long
         assert avg_buy_long <= avg_buy_neutral
@@ -165,10 +210,8 @@ class TestInventorySkewStrategy:
         quotes_short = strategy.compute_quotes(context)
 
         # Compare average sell prices
-        avg_sell_neutral = sum(q.price for q in quotes_neutral if q.side == "sell") / 3
-        avg_sell_short = sum(q.price for q in quotes_short if q.side == "sell") / max(
-            1, len([q for q in quotes_short if q.side == "sell"])
-        )
+        avg_sell_neutral = _avg_price(quotes_neutral, Side.SELL)
+        avg_sell_short = _avg_price(quotes_short, Side.SELL)
 
         # Prices should be higher (skewed up) when short
         assert avg_sell_short >= avg_sell_neutral
@@ -252,3 +295,59 @@ class TestStrategyHaltConditions:
 
         assert decision.should_halt
         assert "exceeded" in decision.halt_reason.lower()
+
+
+class TestRiskCalculator:
+    """Tests for risk metrics."""
+
+    def test_exposure_and_limits(
+        self,
+        settings: MarketMakerSettings,
+        context: MarketContext,
+    ) -> None:
+        """Test order exposure per side and limit usage."""
+        calculator = RiskCalculator(settings)
+        context.add_order(StrategyOrder(
+            cl_ord_id="b1", inst_id="BTC-USDT", side="buy",
+            price=Decimal("49000"), size=Decimal("0.002"),
+        ))
+        context.record_fill("buy", Decimal("0.1"))
+
+        metrics = calculator.calculate(context)
+
+        assert metrics.buy_exposure == Decimal("98")
+        assert metrics.sell_exposure == Decimal("0")
+        assert isinstance(metrics.sell_exposure, Decimal)
+        assert metrics.max_position_used_pct == Decimal("1")
+        assert metrics.is_within_limits
+
+    def test_net_position_limits(self, settings: MarketMakerSettings) -> None:
+        """Test that net position beyond either side's limit breaches limits."""
+        calculator = RiskCalculator(settings)
+        zero = Decimal("0")
+
+        assert calculator._check_limits(Decimal("-10"), zero, zero, zero)
+        assert calculator._check_limits(Decimal("10"), zero, zero, zero)
+        assert not calculator._check_limits(Decimal("-10.1"), zero, zero, zero)
+        assert not calculator._check_limits(Decimal("10.1"), zero, zero, zero)
+        assert not calculator._check_limits(zero, Decimal("10001"), zero, zero)
+
+
+class TestQuantizer:
+    """Tests for tick/lot quantization used by strategy ladders."""
+
+    def test_price_round_trip(self) -> None:
+        """Test price conversion to ticks and back."""
+        quantizer = Quantizer(Decimal("0.01"), Decimal("0.0001"))
+
+        assert quantizer.price_to_ticks(Decimal("50000.125")) == 5000012
+        assert quantizer.float_to_ticks(49950.004) == 4995000
+        assert quantizer.ticks_to_price(4995000) == Decimal("49950.00")
+        assert str(quantizer.ticks_to_price(4995000)) == "49950.00"
+
+    def test_size_rounds_down_to_lots(self) -> None:
+        """Test size conversion rounds down to whole lots."""
+        quantizer = Quantizer(Decimal("0.01"), Decimal("0.0001"))
+
+        assert quantizer.size_to_lots(Decimal("0.00129")) == 12
+        assert quantizer.lots_to_size(12) == Decimal("0.0012")
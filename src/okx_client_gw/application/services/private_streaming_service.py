@@ -157,12 +157,20 @@ class PrivateStreamingService:
             for data in msg.get("data", []):
                 yield Order.from_okx_dict(data)
 
-    async def stream_balance_and_position(self) -> AsyncIterator[BalanceAndPosition]:
+    async def stream_balance_and_position(
+        self,
+        inst_id: str | None = None,
+    ) -> AsyncIterator[BalanceAndPosition]:
         """Stream combined balance and position updates.
 
         Subscribes to balance_and_position channel which is more efficient
         than subscribing to both account and positions separately.
 
+        Args:
+            inst_id: Only parse positions for this instrument ID. The channel
+                has no server-side filter, so other positions are dropped
+                before they are parsed.
+
         Yields:
             BalanceAndPosition objects containing both balance and position updates
 
@@ -176,7 +184,7 @@ class PrivateStreamingService:
                 continue
 
             for data in msg.get("data", []):
-                yield self._parse_balance_and_position(data)
+                yield self._parse_balance_and_position(data, inst_id)
 
     def _is_data_message(self, msg: dict[str, Any], channel: str) -> bool:
         """Check if message is a data push for the specified channel.
@@ -196,11 +204,16 @@ class PrivateStreamingService:
         arg = msg.get("arg", {})
         return arg.get("channel") == channel
 
-    def _parse_balance_and_position(self, data: dict) -> BalanceAndPosition:
+    def _parse_balance_and_position(
+        self,
+        data: dict,
+        inst_id: str | None = None,
+    ) -> BalanceAndPosition:
         """Parse balance_and_position channel data.
 
         Args:
             data: Raw data from balance_and_position channel
+            inst_id: Only parse positions for this instrument ID
 
         Returns:
             BalanceAndPosition with parsed balances and positions
@@ -215,6 +228,7 @@ class PrivateStreamingService:
         positions = [
             Position.from_okx_dict(p)
             for p in data.get("posData", [])
+            if inst_id is None or p.get("instId") == inst_id
         ]
 
         # Parse push time
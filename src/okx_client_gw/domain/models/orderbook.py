@@ -37,11 +37,13 @@ class OrderBookLevel(BaseModel):
         Returns:
             OrderBookLevel instance.
         """
+        # Pass the strings through so validation parses them once (this runs
+        # for every level of every streamed book)
         return cls(
-            price=Decimal(data[0]),
-            size=Decimal(data[1]),
-            liquidated_orders=int(data[2]) if len(data) > 2 else 0,
-            num_orders=int(data[3]) if len(data) > 3 else 1,
+            price=data[0],
+            size=data[1],
+            liquidated_orders=data[2] if len(data) > 2 else 0,
+            num_orders=data[3] if len(data) > 3 else 1,
         )
 
 